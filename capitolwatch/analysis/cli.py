@@ -27,12 +27,19 @@ FIGURES_DIR = Path("data/figures")
 
 
 @app.command()
-def features() -> None:
+def features(
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild even if the store is up to date with the database"
+    ),
+) -> None:
     """
     Build the feature store from the database.
 
     Computes freq_baseline, freq_weighted, and sector_baseline matrices,
-    then saves them to data/outputs/.
+    then saves them to data/outputs/. Skipped when the database has not
+    changed since the last build, unless --force is given.
 
     Example:
         python -m capitolwatch.analysis features
@@ -42,8 +49,10 @@ def features() -> None:
     from capitolwatch.analysis.feature_store import build_feature_store
 
     try:
-        build_feature_store()
-        typer.secho("Feature store built", fg=typer.colors.GREEN)
+        if build_feature_store(force=force):
+            typer.secho("Feature store built", fg=typer.colors.GREEN)
+        else:
+            typer.secho("Feature store up to date", fg=typer.colors.GREEN)
     except Exception as exc:
         typer.secho(
             f"Feature store build failed: {exc}", fg=typer.colors.RED, err=True
@@ -57,6 +66,7 @@ def evaluate() -> None:
     Evaluate all 6 clustering experiments (internal + external metrics).
 
     Fits K-Means, DBSCAN, and SOM and computes internal and external metrics.
+    The external evaluation reuses the labels fitted for the internal one.
     Results are exported to data/outputs/ (CSV) and data/figures/ (PNG).
 
     Example:
@@ -165,11 +175,21 @@ def visualize() -> None:
 
 
 @app.command()
-def full_pipeline() -> None:
+def full_pipeline(
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild the feature store even if it is up to date"
+    ),
+) -> None:
     """
     Run the complete analysis pipeline:
         features → evaluate → analyze → visualize
 
+    The later steps reuse the labels fitted during evaluation. The feature
+    store is only rebuilt when the database changed, or when --force is
+    given (e.g. after a feature engineering change).
+
     Example:
         python -m capitolwatch.analysis full-pipeline
     """
@@ -187,8 +207,10 @@ def full_pipeline() -> None:
     )
     from capitolwatch.analysis.feature_store import build_feature_store
     try:
-        build_feature_store()
-        typer.secho("Feature store built", fg=typer.colors.GREEN)
+        if build_feature_store(force=force):
+            typer.secho("Feature store built", fg=typer.colors.GREEN)
+        else:
+            typer.secho("Feature store up to date", fg=typer.colors.GREEN)
     except Exception as exc:
         typer.secho(
             f"Feature store failed: {exc}",
@@ -57,12 +57,34 @@ class ClusterProfile:
         self.party_distribution: dict = {}
 
 
+def compute_politician_stats(assets_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate the portfolio total and diversity of every politician.
+
+    These statistics do not depend on the clustering, so they can be
+    computed once and shared by every experiment.
+
+    Args:
+        assets_df (pd.DataFrame): Investment data with politician_id, subtype,
+            value_numeric columns.
+
+    Returns:
+        pd.DataFrame: Indexed by politician_id, with columns total (sum of
+            value_numeric) and diversity (number of distinct subtypes).
+    """
+    return assets_df.groupby("politician_id").agg(
+        total=("value_numeric", "sum"),
+        diversity=("subtype", "nunique"),
+    )
+
+
 def compute_cluster_profiles(
     labels: np.ndarray,
     politicians_df: pd.DataFrame,
     assets_df: pd.DataFrame,
     experiment: str,
     top_n_subtypes: int = 5,
+    politician_stats: Optional[pd.DataFrame] = None,
 ) -> list:
     """
     Calculate statistics for each cluster.
@@ -80,63 +102,88 @@ def compute_cluster_profiles(
         experiment (str): Name of this run, e.g. "dbscan / freq_weighted".
         top_n_subtypes (int): How many top investment types to include
             (default: 5).
+        politician_stats (pd.DataFrame, optional): Output of
+            compute_politician_stats() for assets_df, computed here if None.
 
     Returns:
         list: One ClusterProfile per cluster, with outliers last.
     """
+    labels = np.asarray(labels)
     unique_labels = sorted(set(labels))
     # Put -1 (outliers) at the end so regular clusters come first
     if -1 in unique_labels:
         unique_labels = [lbl for lbl in unique_labels if lbl != -1] + [-1]
 
+    # politicians_df is positionally aligned with labels
+    members = politicians_df.reset_index(drop=True)
+    # row positions of every cluster's members, from a single grouping
+    member_positions = members.groupby(labels, sort=False).indices
+    # (cluster, party) counts in one pass; sort=False keeps parties in
+    # order of first appearance within each cluster, like value_counts
+    party_counts = members.groupby(
+        [labels, members["party"]], sort=False
+    ).size()
+    clusters_with_party = set(party_counts.index.get_level_values(0))
+
+    # Tag every asset with its owner's cluster once, then aggregate all
+    # clusters in a single groupby pass instead of one scan per cluster
+    cluster_of = pd.Series(labels, index=members["id"].to_numpy())
+    cluster_of = cluster_of[~cluster_of.index.duplicated()]
+    assets = assets_df.assign(
+        cluster_id=assets_df["politician_id"].map(cluster_of)
+    ).dropna(subset=["cluster_id"])
+
+    # Mean of the per-politician totals and diversities across the
+    # politicians of each cluster
+    if politician_stats is None:
+        politician_stats = compute_politician_stats(assets_df)
+    stats_cluster = politician_stats.index.map(cluster_of)
+    has_cluster = stats_cluster.notna()
+    cluster_means = politician_stats[has_cluster].groupby(
+        stats_cluster[has_cluster]
+    ).mean()
+
+    # Mean invested value per (cluster, subtype)
+    subtype_means = assets.groupby(["cluster_id", "subtype"])[
+        "value_numeric"
+    ].mean()
+    clusters_with_assets = set(cluster_means.index)
+
     profiles = []
 
     for cid in unique_labels:
         profile = ClusterProfile(cluster_id=cid, experiment=experiment)
-        mask = labels == cid
+        positions = member_positions[cid]
 
         # 1. Politicians in this cluster
-        # politicians_df is positionally aligned with labels, so boolean mask
-        # works
-        profile.politicians = politicians_df[mask].reset_index(drop=True)
-        profile.size = int(mask.sum())
+        profile.politicians = members.iloc[positions].reset_index(drop=True)
+        profile.size = len(positions)
 
         # 2. Party distribution
-        party_counts = profile.politicians["party"].value_counts()
+        counts = (
+            party_counts.loc[cid].sort_values(ascending=False)
+            if cid in clusters_with_party
+            else pd.Series(dtype=int)
+        )
         profile.party_distribution = {
             party: round(count / profile.size * 100, 1)
-            for party, count in party_counts.items()
+            for party, count in counts.items()
         }
 
-        # 3. Assets for these politicians
-        member_ids = profile.politicians["id"].tolist()
-        member_assets = assets_df[assets_df["politician_id"].isin(member_ids)]
-
-        # 4. Mean total portfolio value per politician
-        # Sum all values per politician, then take the mean across politicians
-        total_per_politician = (
-            member_assets.groupby("politician_id")["value_numeric"].sum()
-        )
-        profile.mean_total_value = float(total_per_politician.mean())
-
-        # 5. Mean diversity (distinct subtypes per politician)
-        diversity_per_politician = (
-            member_assets.groupby("politician_id")["subtype"].nunique()
-        )
-        profile.mean_diversity = float(diversity_per_politician.mean())
-
-        # 6. Top subtypes by mean invested value
-        # Group all assets by subtype, compute mean value across all members,
-        # then take the top-N.
-        if not member_assets.empty:
-            subtype_values = (
-                member_assets.groupby("subtype")["value_numeric"]
-                .mean()
-                .sort_values(ascending=False)
-                .head(top_n_subtypes)
+        # 3. Mean total value and diversity, NaN if the cluster has no assets
+        if cid in clusters_with_assets:
+            profile.mean_total_value = float(cluster_means.at[cid, "total"])
+            profile.mean_diversity = float(
+                cluster_means.at[cid, "diversity"]
             )
+
+            # 4. Top subtypes by mean invested value; nlargest selects the
+            # top N without sorting every subtype of the cluster
+            subtype_values = subtype_means.loc[cid].nlargest(top_n_subtypes)
             profile.top_subtypes = list(subtype_values.items())
         else:
+            profile.mean_total_value = float("nan")
+            profile.mean_diversity = float("nan")
             profile.top_subtypes = []
 
         profiles.append(profile)
@@ -277,10 +324,13 @@ def generate_cluster_report(
         # List all politicians in this cluster
         lines.append("Politicians in this cluster:")
         lines.append("")
-        for _, row in p.politicians.iterrows():
-            lines.append(
-                f"- {row['first_name']} {row['last_name']} ({row['party']})"
-            )
+        members = p.politicians.astype(str)
+        lines.extend(
+            (
+                "- " + members["first_name"] + " " + members["last_name"]
+                + " (" + members["party"] + ")"
+            ).tolist()
+        )
         lines.append("")
 
     return "\n".join(lines)
@@ -327,6 +377,7 @@ def run_analysis(
     feature_type: str,
     output_dir: Optional[Path] = None,
     top_n_subtypes: int = 5,
+    politician_stats: Optional[pd.DataFrame] = None,
 ) -> list:
     """
     Analyze clusters and generate a Markdown report.
@@ -344,6 +395,8 @@ def run_analysis(
         output_dir (Path, optional): Where to save the report (default:
             data/figures/cluster_profiles/).
         top_n_subtypes (int): How many investment types to show (default: 5).
+        politician_stats (pd.DataFrame, optional): Precomputed output of
+            compute_politician_stats(), shared across experiments.
 
     Returns:
         list: One ClusterProfile per cluster.
@@ -358,6 +411,7 @@ def run_analysis(
         assets_df=assets_df,
         experiment=experiment,
         top_n_subtypes=top_n_subtypes,
+        politician_stats=politician_stats,
     )
 
     # 2. Generate Markdown
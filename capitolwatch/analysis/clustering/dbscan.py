@@ -5,7 +5,6 @@
 import os
 
 import numpy as np
-import matplotlib.pyplot as plt
 from sklearn.cluster import DBSCAN
 from sklearn.decomposition import PCA
 from sklearn.metrics import silhouette_score
@@ -226,19 +225,24 @@ class DBSCANClusterer(BaseClusterer):
         if self.labels_ is None:
             raise RuntimeError("Model is not fitted. Call fit() first.")
 
-        outliers = []
-        # iterate over all labels and collect noise points (label == -1)
-        for i, label in enumerate(self.labels_):
-            if label == -1:
-                # extract politician metadata from the DataFrame row
-                row = politician_labels.iloc[i]
-                outliers.append({
-                    "index": i,
-                    "first_name": row["first_name"],
-                    "last_name": row["last_name"],
-                    "party": row["party"]
-                })
-        return outliers
+        # positions of noise points (label == -1), then read each metadata
+        # column once instead of materializing one row Series per outlier
+        noise_idx = np.flatnonzero(self.labels_ == -1)
+        noise_rows = politician_labels.iloc[noise_idx]
+        return [
+            {
+                "index": i,
+                "first_name": first_name,
+                "last_name": last_name,
+                "party": party,
+            }
+            for i, first_name, last_name, party in zip(
+                noise_idx.tolist(),
+                noise_rows["first_name"].tolist(),
+                noise_rows["last_name"].tolist(),
+                noise_rows["party"].tolist(),
+            )
+        ]
 
     def plot_grid_search(
         self,
@@ -260,6 +264,8 @@ class DBSCANClusterer(BaseClusterer):
                 tested.
             save_path (str): Path where the PNG will be saved.
         """
+        import matplotlib.pyplot as plt
+
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         # build a 2D score matrix: rows = eps, columns = min_samples
@@ -308,6 +314,8 @@ class DBSCANClusterer(BaseClusterer):
         if self.labels_ is None:
             raise RuntimeError("Model is not fitted. Call fit() first.")
 
+        import matplotlib.pyplot as plt
+
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         # project the high-dimensional feature matrix down to 2 components
@@ -349,9 +357,13 @@ class DBSCANClusterer(BaseClusterer):
             )
             # annotate each outlier with the politician's name
             if politician_labels is not None:
-                for i in np.where(outlier_mask)[0]:
-                    row = politician_labels.iloc[i]
-                    name = f"{row['first_name']} {row['last_name']}"
+                outlier_idx = np.flatnonzero(outlier_mask)
+                outlier_rows = politician_labels.iloc[outlier_idx]
+                names = (
+                    outlier_rows["first_name"].astype(str) + " "
+                    + outlier_rows["last_name"].astype(str)
+                ).tolist()
+                for i, name in zip(outlier_idx, names):
                     ax.annotate(
                         name,
                         xy=(coords[i, 0], coords[i, 1]),
@@ -3,7 +3,6 @@
 # (http://www.apache.org/licenses/LICENSE-2.0)
 
 import numpy as np
-import matplotlib.pyplot as plt
 from sklearn.cluster import KMeans
 from sklearn.metrics import silhouette_score
 
@@ -136,6 +135,7 @@ class KMeansClusterer(BaseClusterer):
             save_path (str): Path where the PNG will be saved.
         """
         import os
+        import matplotlib.pyplot as plt
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         fig, ax = plt.subplots(figsize=(8, 5))
@@ -162,12 +162,12 @@ class KMeansClusterer(BaseClusterer):
             save_path (str): Path where the PNG will be saved.
         """
         import os
+        import matplotlib.pyplot as plt
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         fig, ax = plt.subplots(figsize=(8, 5))
         ax.plot(k_values, silhouette_scores, marker='o')
-        max_score = max(silhouette_scores)
-        max_index = silhouette_scores.index(max_score)
+        max_index = int(np.argmax(silhouette_scores))
         ax.axvline(x=k_values[max_index], color='r', linestyle='--')
         ax.set_title("Silhouette Score vs K")
         ax.set_xlabel("Number of Clusters (K)")
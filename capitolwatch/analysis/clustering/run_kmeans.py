@@ -62,8 +62,9 @@ def _find_and_plot_optimal_k(
         k_values, sil_scores,
         save_path=f"data/figures/kmeans_silhouette_{feature_type}.png",
     )
-    best_k = k_values[sil_scores.index(max(sil_scores))]
-    return best_k, round(max(sil_scores), 4)
+    # One argmax pass instead of max() + index() + a second max()
+    best = int(np.argmax(sil_scores))
+    return k_values[best], round(sil_scores[best], 4)
 
 
 def _fit_and_analyze(X: np.ndarray, best_k: int, politician_labels) -> tuple:
@@ -84,16 +85,34 @@ def _fit_and_analyze(X: np.ndarray, best_k: int, politician_labels) -> tuple:
     unique, counts = np.unique(clusterer.labels_, return_counts=True)
     cluster_sizes = dict(zip(unique.tolist(), counts.tolist()))
 
-    outliers = []
-    for i, lbl in enumerate(clusterer.labels_):
-        if counts[lbl] == 1:
-            row = politician_labels.iloc[i]
-            outliers.append({
-                "index": i,
-                "first_name": row.get("first_name", ""),
-                "last_name": row.get("last_name", ""),
-                "party": row.get("party", "N/A"),
-            })
+    # labels are 0..k-1, so counts[labels_] is each sample's cluster size;
+    # only singleton members are visited in Python
+    singleton_idx = np.flatnonzero(counts[clusterer.labels_] == 1)
+
+    # Gather the singleton rows with one positional take and read each
+    # column once, instead of building a row Series per outlier
+    singleton_rows = politician_labels.iloc[singleton_idx]
+
+    def column_values(column, default):
+        """Column values of the singleton rows, or default if missing."""
+        if column in singleton_rows:
+            return singleton_rows[column].tolist()
+        return [default] * len(singleton_idx)
+
+    outliers = [
+        {
+            "index": i,
+            "first_name": first_name,
+            "last_name": last_name,
+            "party": party,
+        }
+        for i, first_name, last_name, party in zip(
+            singleton_idx.tolist(),
+            column_values("first_name", ""),
+            column_values("last_name", ""),
+            column_values("party", "N/A"),
+        )
+    ]
     return cluster_sizes, outliers
 
 
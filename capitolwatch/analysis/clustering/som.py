@@ -5,12 +5,48 @@
 import os
 
 import numpy as np
-import matplotlib.pyplot as plt
-from minisom import MiniSom
 from sklearn.cluster import KMeans
 
 from capitolwatch.analysis.clustering.base import BaseClusterer
 
+# Above this many (sample, neuron) pairs, the fused numba loop avoids
+# materializing the full distance matrix; the GEMM fallback processes
+# samples in blocks of at most this many distances instead
+_DISTANCE_BLOCK_SIZE = 1 << 20
+
+
+def _numba_bmu_kernel():
+    """
+    Return the numba BMU kernel, or None when numba is not installed.
+
+    numba is imported lazily and only for searches above
+    _DISTANCE_BLOCK_SIZE pairs: below that, the GEMM lookup is much
+    faster than importing and compiling the kernel.
+    """
+    try:  # pragma: no cover - optional dep
+        from capitolwatch.analysis.clustering.som_kernels import bmu_indices
+    except ImportError:  # pragma: no cover - optional dep
+        return None
+    return bmu_indices
+
+
+def _asymptotic_schedule(initial: float, n_iterations: int) -> np.ndarray:
+    """
+    Precompute MiniSom's asymptotic decay for every training step.
+
+    Same formula as MiniSom._asymptotic_decay, evaluated once for all
+    steps: initial / (1 + t / (n_iterations / 2)).
+
+    Args:
+        initial (float): Value at step 0 (sigma or learning rate).
+        n_iterations (int): Number of training steps.
+
+    Returns:
+        np.ndarray: Decayed value per step, shape (n_iterations,).
+    """
+    steps = np.arange(n_iterations)
+    return initial / (1 + steps / (n_iterations / 2))
+
 
 class SOMClusterer(BaseClusterer):
     """
@@ -26,8 +62,14 @@ class SOMClusterer(BaseClusterer):
             neurons around the BMU are updated during training.
         learning_rate (float): Initial step size for weight updates;
             decays during training.
-        n_iterations (int): Total number of training steps.
+        n_iterations (int): Total number of training steps (epochs when
+            batch is True).
         random_seed (int): Seed for reproducibility.
+        batch (bool): If True, train with the batch SOM algorithm (one
+            vectorized update per epoch over all samples) instead of
+            MiniSom's online, sample-by-sample updates. Off by default:
+            the pipeline trains online, and batch mode is enabled with
+            SOMClusterer(..., batch=True).
         n_clusters (int or None): Number of clusters extracted via K-Means
             on neuron weights. Set by extract_clusters().
         labels_ (np.ndarray or None): Cluster label per sample. Set by
@@ -44,6 +86,7 @@ class SOMClusterer(BaseClusterer):
         learning_rate: float = 0.5,
         n_iterations: int = 1000,
         random_seed: int = 42,
+        batch: bool = False,
     ):
         self.m = m
         self.n = n
@@ -51,7 +94,9 @@ class SOMClusterer(BaseClusterer):
         self.learning_rate = learning_rate
         self.n_iterations = n_iterations
         self.random_seed = random_seed
+        self.batch = batch
         self._som = None
+        self._codebook = None
         self.labels_ = None
         self.bmu_coords_ = None
         self.n_clusters = None
@@ -71,7 +116,11 @@ class SOMClusterer(BaseClusterer):
         Returns:
             self
         """
+        from minisom import MiniSom
+
         n_features = matrix.shape[1]
+        # weights change during training; drop any previous cached codebook
+        self._codebook = None
 
         # initialize MiniSom with grid dimensions and training parameters
         self._som = MiniSom(
@@ -86,7 +135,14 @@ class SOMClusterer(BaseClusterer):
         # Initialize neuron weights randomly in [0, 1] and train the SOM
         # on the data
         self._som.random_weights_init(matrix)
-        self._som.train(matrix, self.n_iterations)
+        if self.batch:
+            self._train_batch(matrix)
+        else:
+            self._som.train(matrix, self.n_iterations)
+
+        # the trained weights no longer change: flatten them and compute
+        # their norms once for every later BMU lookup
+        self._codebook = self._flat_codebook()
 
         # Store the BMU coordinate (row, col) for every sample
         self.bmu_coords_ = self.get_bmu_coords(matrix)
@@ -106,8 +162,54 @@ class SOMClusterer(BaseClusterer):
             "learning_rate": self.learning_rate,
             "n_iterations": self.n_iterations,
             "random_seed": self.random_seed,
+            "batch": self.batch,
         }
 
+    def _train_batch(self, matrix: np.ndarray) -> None:
+        """
+        Train the SOM weights with the batch algorithm.
+
+        Each epoch assigns every sample to its BMU, then sets each neuron
+        to the neighborhood-weighted mean of the samples:
+        W = (H @ A.T @ X) / (H @ A.T @ 1), where A is the one-hot BMU
+        assignment and H the Gaussian neighborhood between neurons.
+        There is no learning rate; sigma shrinks with the same asymptotic
+        decay MiniSom uses for online training.
+
+        Args:
+            matrix (np.ndarray): Feature matrix of shape (n_samples,
+                n_features).
+        """
+        samples = np.asarray(matrix, dtype=float)
+        n_neurons = self.m * self.n
+
+        # squared grid distance between every pair of neurons
+        rows, cols = np.divmod(np.arange(n_neurons), self.n)
+        grid_dist2 = (
+            (rows[:, np.newaxis] - rows[np.newaxis, :]) ** 2
+            + (cols[:, np.newaxis] - cols[np.newaxis, :]) ** 2
+        )
+
+        sigmas = _asymptotic_schedule(self.sigma, self.n_iterations)
+        for sigma in sigmas:
+            neighborhood = np.exp(-grid_dist2 / (2 * sigma * sigma))
+
+            # A.T @ X and A.T @ 1 are per-neuron sample sums and counts;
+            # accumulate them directly instead of writing the dense
+            # (n_samples, m*n) one-hot matrix every epoch
+            bmus = self._bmu_indices(samples)
+            sample_sums = np.zeros((n_neurons, samples.shape[1]))
+            np.add.at(sample_sums, bmus, samples)
+            sample_counts = np.bincount(bmus, minlength=n_neurons)
+
+            numerator = neighborhood @ sample_sums
+            denominator = neighborhood @ sample_counts
+
+            # neurons with no weighted support keep their previous weights
+            weights = self._som._weights.reshape(n_neurons, -1)
+            mask = denominator > 0
+            weights[mask] = numerator[mask] / denominator[mask, np.newaxis]
+
     def get_bmu_coords(self, matrix: np.ndarray) -> list:
         """
         Find the Best Matching Unit (BMU) for each sample in matrix.
@@ -126,8 +228,66 @@ class SOMClusterer(BaseClusterer):
         if self._som is None:
             raise RuntimeError("Model is not fitted. Call fit() first.")
 
-        # winner(x) returns the (row, col) of the closest neuron to x
-        return [self._som.winner(sample) for sample in matrix]
+        flat_bmus = self._bmu_indices(matrix)
+        rows, cols = np.divmod(flat_bmus, self.n)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def _flat_codebook(self) -> tuple:
+        """
+        Flatten the neuron weights for the BMU distance computation.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: float32 weights of shape
+                (m*n, n_features) and their squared norms, shape (m*n,).
+        """
+        # float32 halves the memory traffic of the distance computation;
+        # inputs are MinMax-scaled so single precision is ample
+        weights = self._som.get_weights().reshape(
+            self.m * self.n, -1
+        ).astype(np.float32)
+        weight_norms = np.einsum("ij,ij->i", weights, weights)
+        return weights, weight_norms
+
+    def _bmu_indices(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Compute the flat neuron index of the BMU for every sample at once.
+
+        Uses the expansion ||x - w||^2 = ||x||^2 + ||w||^2 - 2 x.w so all
+        sample-to-neuron distances come from a single float32 matrix
+        product instead of one winner() call per sample.
+
+        Args:
+            matrix (np.ndarray): Feature matrix of shape (n_samples,
+                n_features).
+
+        Returns:
+            np.ndarray: Flat neuron index (row * n + col) per sample.
+        """
+        samples = np.asarray(matrix, dtype=np.float32)
+        # cached after fit(); recomputed while weights are still training
+        weights, weight_norms = self._codebook or self._flat_codebook()
+
+        n_samples = samples.shape[0]
+        n_pairs = n_samples * weights.shape[0]
+
+        if n_pairs > _DISTANCE_BLOCK_SIZE:
+            kernel = _numba_bmu_kernel()
+            if kernel is not None:  # pragma: no cover - optional dep
+                return kernel(
+                    np.ascontiguousarray(samples),
+                    np.ascontiguousarray(weights),
+                )
+
+        # ||x||^2 is constant per row so it does not change the argmin and
+        # can be skipped; rows are processed in blocks to bound the size of
+        # the (block, m*n) distance matrix
+        block = max(1, _DISTANCE_BLOCK_SIZE // weights.shape[0])
+        bmus = np.empty(n_samples, dtype=np.int64)
+        for start in range(0, n_samples, block):
+            chunk = samples[start:start + block]
+            distances = weight_norms[np.newaxis, :] - 2.0 * chunk @ weights.T
+            bmus[start:start + block] = np.argmin(distances, axis=1)
+        return bmus
 
     def compute_umatrix(self) -> np.ndarray:
         """
@@ -184,12 +344,10 @@ class SOMClusterer(BaseClusterer):
         neuron_labels = kmeans.labels_
 
         # convert each sample's BMU (row, col) to a flat neuron index,
-        # then look up which cluster that neuron belongs to
-        sample_labels = [
-            neuron_labels[row * self.n + col]
-            for row, col in self.bmu_coords_
-        ]
-        self.labels_ = np.array(sample_labels)
+        # then look up which cluster that neuron belongs to, for all
+        # samples in one indexing operation
+        rows, cols = np.asarray(self.bmu_coords_).reshape(-1, 2).T
+        self.labels_ = neuron_labels[rows * self.n + cols]
         return self.labels_
 
     def plot_umatrix(
@@ -215,6 +373,8 @@ class SOMClusterer(BaseClusterer):
         if self._som is None:
             raise RuntimeError("Model is not fitted. Call fit() first.")
 
+        import matplotlib.pyplot as plt
+
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         umatrix = self.compute_umatrix()
@@ -231,22 +391,25 @@ class SOMClusterer(BaseClusterer):
         if matrix is not None and politician_labels is not None:
             party_colors = {"Republican": "red", "Democratic": "blue"}
             bmu_coords = self.get_bmu_coords(matrix)
+            rows, cols = np.asarray(bmu_coords).T
+            colors = (
+                politician_labels["party"].map(party_colors)
+                .fillna("green").to_numpy()
+            )
+            # small jitter so overlapping BMUs are distinguishable; one
+            # (row, col) draw per point, same sequence as drawing them
+            # one by one
             rng = np.random.default_rng(seed=0)
-            # add jitter to points so overlapping BMUs are distinguishable,
-            # and color by party
-            for i, (row, col) in enumerate(bmu_coords):
-                party = politician_labels.iloc[i]["party"]
-                color = party_colors.get(party, "green")
-                # small jitter so overlapping BMUs are distinguishable
-                jitter = 0.3 * (rng.random(2) - 0.5)
-                ax.scatter(
-                    col + jitter[1],
-                    row + jitter[0],
-                    color=color,
-                    s=40,
-                    alpha=0.7,
-                    zorder=3,
-                )
+            jitter = 0.3 * (rng.random((len(bmu_coords), 2)) - 0.5)
+            # a single scatter call colored by party
+            ax.scatter(
+                cols + jitter[:, 1],
+                rows + jitter[:, 0],
+                c=colors,
+                s=40,
+                alpha=0.7,
+                zorder=3,
+            )
             # build a minimal legend for party colors
             for party, color in party_colors.items():
                 ax.scatter([], [], color=color, s=40, label=party)
@@ -281,6 +444,8 @@ class SOMClusterer(BaseClusterer):
                 "Labels not set. Call extract_clusters() after fit()."
             )
 
+        import matplotlib.pyplot as plt
+
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         bmu_coords = self.get_bmu_coords(matrix)
@@ -288,23 +453,28 @@ class SOMClusterer(BaseClusterer):
 
         fig, ax = plt.subplots(figsize=(12, 10))
 
-        # draw a colored circle at each politician's BMU, by cluster
-        for i, (row, col) in enumerate(bmu_coords):
-            cluster_id = self.labels_[i]
-            ax.scatter(
-                col,
-                row,
-                color=colors[cluster_id % len(colors)],
-                s=300,
-                alpha=0.4,
-                zorder=1,
-            )
+        # draw a colored circle at each politician's BMU, by cluster, in a
+        # single scatter call
+        rows, cols = np.asarray(bmu_coords).T
+        point_colors = np.asarray(colors)[self.labels_ % len(colors)]
+        ax.scatter(
+            cols,
+            rows,
+            color=point_colors,
+            s=300,
+            alpha=0.4,
+            zorder=1,
+        )
 
         # annotate with abbreviated name (initial + last name)
         if politician_labels is not None:
-            for i, (row, col) in enumerate(bmu_coords):
-                p = politician_labels.iloc[i]
-                name = f"{p['first_name'][0]}. {p['last_name']}"
+            # build every label from the name columns at once rather than
+            # reading one row Series per politician
+            names = (
+                politician_labels["first_name"].str[0] + ". "
+                + politician_labels["last_name"]
+            ).tolist()
+            for name, (row, col) in zip(names, bmu_coords):
                 ax.annotate(
                     name,
                     xy=(col, row),
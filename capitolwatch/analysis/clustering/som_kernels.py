@@ -0,0 +1,34 @@
+# Copyright (c) 2026 Seizh7
+# Licensed under the Apache License, Version 2.0
+# (http://www.apache.org/licenses/LICENSE-2.0)
+
+"""
+Numba kernels for the SOM.
+
+Importing numba takes a noticeable fraction of a second, so som.py only
+imports this module for BMU searches large enough to benefit from it.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def bmu_indices(samples, weights):
+    """Squared Euclidean argmin over neurons, one sample per thread."""
+    n_samples, n_features = samples.shape
+    n_neurons = weights.shape[0]
+    bmus = np.empty(n_samples, dtype=np.int64)
+    for i in prange(n_samples):
+        # Seeded from neuron 0 rather than np.inf: fastmath assumes
+        # no infinities occur
+        best, best_dist = 0, 0.0
+        for k in range(n_neurons):
+            dist = 0.0
+            for d in range(n_features):
+                diff = samples[i, d] - weights[k, d]
+                dist += diff * diff
+            if k == 0 or dist < best_dist:
+                best, best_dist = k, dist
+        bmus[i] = best
+    return bmus
@@ -14,9 +14,19 @@ Main functions:
 """
 
 import re
+
+import numpy as np
+import pandas as pd
+
 from config import CONFIG
+from capitolwatch.db import get_connection
 from capitolwatch.services.analytics import get_active_politicians_dataframe
 
+# Value range patterns, compiled once instead of on every parse
+_THRESHOLD_RE = re.compile(r"\$(\d+[,\d]*)")
+_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+_PLUS_RE = re.compile(r"(\d+)\+")
+
 
 def parse_value_range(value_str):
     """
@@ -41,7 +51,7 @@ def parse_value_range(value_str):
     # "None (or less than $201)"
     if "less than" in value_str:
         # Extract the threshold value
-        threshold_match = re.search(r"\$(\d+[,\d]*)", value_str)
+        threshold_match = _THRESHOLD_RE.search(value_str)
         if threshold_match:
             threshold = float(threshold_match.group(1).replace(",", ""))
             return threshold
@@ -53,33 +63,35 @@ def parse_value_range(value_str):
 
     cleaned = value_str.replace("$", "").replace(",", "").strip()
 
-    range_pattern = r"(\d+)\s*-\s*(\d+)"
-
     # If value is in range format
-    match = re.search(range_pattern, cleaned)
+    match = _RANGE_RE.search(cleaned)
     if match:
         min_value = float(match.group(1))
         max_value = float(match.group(2))
         return (min_value + max_value) / 2
 
     # If value is in "plus" format
-    plus_pattern = r"(\d+)\+"
-    match_plus = re.search(plus_pattern, cleaned)
+    match_plus = _PLUS_RE.search(cleaned)
     if match_plus:
         return float(match_plus.group(1))
 
     return 0.0
 
 
-def load_politicians():
+def load_politicians(connection=None):
     """
     Load active politicians (those with at least 1 asset).
 
+    Args:
+        connection: Optional existing DB connection to reuse.
+
     Returns:
         pd.DataFrame: DataFrame [id, first_name, last_name, party]
     """
 
-    df = get_active_politicians_dataframe(config=CONFIG)
+    df = get_active_politicians_dataframe(
+        config=CONFIG, connection=connection
+    )
 
     # Validation: check structure and content
     if len(df) == 0:
@@ -95,7 +107,7 @@ def load_politicians():
     return df
 
 
-def load_assets_with_products():
+def load_assets_with_products(connection=None):
     """
     Load enriched assets with product information.
 
@@ -104,6 +116,9 @@ def load_assets_with_products():
         - products table (financial products)
         - politicians table (to filter active assets)
 
+    Args:
+        connection: Optional existing DB connection to reuse.
+
     Returns:
         pd.DataFrame: Enriched DataFrame with columns:
                      [asset_id, politician_id, product_id, value,
@@ -113,24 +128,28 @@ def load_assets_with_products():
         get_assets_with_products_dataframe
     )
 
-    df = get_assets_with_products_dataframe(config=CONFIG)
+    df = get_assets_with_products_dataframe(
+        config=CONFIG, connection=connection
+    )
 
     # Validate dataset is not empty
     if len(df) == 0:
         raise ValueError("No assets found in database")
 
-    # Normalize empty subtypes to 'Uncategorized'
-    df['subtype'] = (df['subtype']
-                     .fillna('Uncategorized')
-                     .replace('', 'Uncategorized'))
-
-    # Normalize empty sectors to 'Uncategorized'
-    df['sector'] = (df['sector']
-                    .fillna('Uncategorized')
-                    .replace('', 'Uncategorized'))
-
-    # Creates a numeric representation of value ranges for analysis
-    df['value_numeric'] = df['value'].apply(parse_value_range)
+    # Empty subtypes and sectors are already normalized to 'Uncategorized'
+    # by the query
+
+    # Creates a numeric representation of value ranges for analysis.
+    # Disclosures only use a handful of distinct range strings, so each one
+    # is parsed once into a float array and the column is filled by
+    # indexing it with each row's code, without a per-row dict lookup
+    codes, unique_values = pd.factorize(df['value'], use_na_sentinel=False)
+    parsed_values = np.fromiter(
+        (parse_value_range(value) for value in unique_values),
+        dtype=np.float64,
+        count=len(unique_values),
+    )
+    df['value_numeric'] = parsed_values[codes]
 
     # Validation: check required columns exist
     required_columns = [
@@ -164,8 +183,13 @@ def get_dataset_summary():
               - mean_value: Mean asset value
               - median_value: Median asset value
     """
-    politicians = load_politicians()
-    assets = load_assets_with_products()
+    # Both loads share one connection
+    connection = get_connection(CONFIG)
+    try:
+        politicians = load_politicians(connection=connection)
+        assets = load_assets_with_products(connection=connection)
+    finally:
+        connection.close()
 
     summary = {
         'n_politicians': len(politicians),
@@ -66,11 +66,12 @@ def evaluate_clustering(
         dict: Keys : algo_name, feature_type, n_clusters, n_outliers,
             silhouette.
     """
-    # Count the number of outliers (labels == -1)
-    n_outliers = int(np.sum(labels == -1))
+    # Build the outlier mask once and reuse it for both counts
+    noise = labels == -1
+    n_outliers = int(np.count_nonzero(noise))
 
     # Count valid clusters (unique labels excluding -1)
-    n_clusters = int(len(np.unique(labels[labels != -1])))
+    n_clusters = int(len(np.unique(labels[~noise])))
 
     # Calculate silhouette score using the function defined above
     silhouette = calculate_silhouette_score(X, labels)
@@ -125,6 +126,30 @@ def export_results(df: pd.DataFrame, output_path: str) -> None:
     df.to_csv(output_path, index=False)
 
 
+def _drop_outliers(
+    labels_true: np.ndarray,
+    labels_pred: np.ndarray,
+):
+    """
+    Remove outlier points (label == -1) from a pair of label arrays.
+
+    Args:
+        labels_true (np.ndarray): Ground-truth labels. Shape (n_samples,).
+        labels_pred (np.ndarray): Cluster labels. Shape (n_samples,).
+
+    Returns:
+        tuple or None: (labels_true, labels_pred) restricted to non-outlier
+            points, or None if fewer than 2 unique predicted labels remain.
+    """
+    mask = labels_pred != -1
+    lp_filtered = labels_pred[mask]
+
+    if len(np.unique(lp_filtered)) < 2:
+        return None
+
+    return labels_true[mask], lp_filtered
+
+
 def calculate_ari(
     labels_true: np.ndarray,
     labels_pred: np.ndarray,
@@ -145,18 +170,12 @@ def calculate_ari(
         float: ARI score in [-1, 1], or np.nan if fewer than 2 unique
             predicted labels remain after filtering.
     """
-    # Create a boolean mask that keeps only non-outlier points
-    mask = labels_pred != -1
-
-    # Apply the mask to both arrays
-    lt_filtered = labels_true[mask]
-    lp_filtered = labels_pred[mask]
-
-    # Guard : return np.nan if fewer than 2 unique labels in lp_filtered
-    if len(np.unique(lp_filtered)) < 2:
+    # Drop outliers; np.nan if fewer than 2 unique predicted labels remain
+    filtered = _drop_outliers(labels_true, labels_pred)
+    if filtered is None:
         return np.nan
 
-    return adjusted_rand_score(lt_filtered, lp_filtered)
+    return adjusted_rand_score(*filtered)
 
 
 def calculate_nmi(
@@ -176,18 +195,13 @@ def calculate_nmi(
         float: NMI score in [0, 1], or np.nan if fewer than 2 unique
             predicted labels remain after filtering.
     """
-    # Same mask + guard pattern as calculate_ari
-    mask = labels_pred != -1
-    lt_filtered = labels_true[mask]
-    lp_filtered = labels_pred[mask]
-
-    if len(np.unique(lp_filtered)) < 2:
+    # Same filter + guard pattern as calculate_ari
+    filtered = _drop_outliers(labels_true, labels_pred)
+    if filtered is None:
         return np.nan
 
     # average_method="arithmetic" is the sklearn default but explicit is better
-    return normalized_mutual_info_score(
-        lt_filtered, lp_filtered, average_method="arithmetic"
-    )
+    return normalized_mutual_info_score(*filtered, average_method="arithmetic")
 
 
 def calculate_v_measure(
@@ -205,16 +219,13 @@ def calculate_v_measure(
     Returns:
         float: V-Measure score in [0, 1], or np.nan if guard triggers.
     """
-    # Same mask + guard pattern as calculate_ari
-    mask = labels_pred != -1
-    lt_filtered = labels_true[mask]
-    lp_filtered = labels_pred[mask]
-
-    if len(np.unique(lp_filtered)) < 2:
+    # Same filter + guard pattern as calculate_ari
+    filtered = _drop_outliers(labels_true, labels_pred)
+    if filtered is None:
         return np.nan
 
     # homogeneity_completeness_v_measure returns a tuple (h, c, v)
-    _, _, v = homogeneity_completeness_v_measure(lt_filtered, lp_filtered)
+    _, _, v = homogeneity_completeness_v_measure(*filtered)
     return float(v)
 
 
@@ -236,9 +247,17 @@ def evaluate_clustering_external(
     Returns:
         dict: Keys : algo_name, feature_type, ari, nmi, v_measure.
     """
-    ari = calculate_ari(labels_true, labels_pred)
-    nmi = calculate_nmi(labels_true, labels_pred)
-    v_measure = calculate_v_measure(labels_true, labels_pred)
+    # Filter outliers once and score the same arrays with every metric
+    filtered = _drop_outliers(labels_true, labels_pred)
+    if filtered is None:
+        ari = nmi = v_measure = np.nan
+    else:
+        ari = adjusted_rand_score(*filtered)
+        nmi = normalized_mutual_info_score(
+            *filtered, average_method="arithmetic"
+        )
+        _, _, v_measure = homogeneity_completeness_v_measure(*filtered)
+        v_measure = float(v_measure)
 
     return {
         "algo_name": algo_name,
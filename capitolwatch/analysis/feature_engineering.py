@@ -2,12 +2,27 @@
 # Licensed under the Apache License, Version 2.0
 # (http://www.apache.org/licenses/LICENSE-2.0)
 
+import numpy as np
 import pandas as pd
 from capitolwatch.analysis.data_loader import (
     load_politicians, load_assets_with_products
 )
 
 
+def _sorted_known_values(values):
+    """
+    Return the sorted distinct values of a Series, minus 'Uncategorized'.
+
+    Args:
+        values (pd.Series): Categorical column, possibly with NaN.
+
+    Returns:
+        list[str]: Sorted distinct values, without 'Uncategorized'.
+    """
+    # unique() runs in C; one set difference replaces a Python-level filter
+    return sorted(set(values.dropna().unique()) - {'Uncategorized'})
+
+
 def get_sorted_subtypes(assets_df):
     """
     Extract a sorted list of known subtypes, excluding 'Uncategorized'.
@@ -18,8 +33,7 @@ def get_sorted_subtypes(assets_df):
     Returns:
         list[str]: Sorted list of known subtype names
     """
-    subtypes = assets_df['subtype'].dropna().unique()
-    return sorted(s for s in subtypes if s != 'Uncategorized')
+    return _sorted_known_values(assets_df['subtype'])
 
 
 def get_sorted_sectors(assets_df):
@@ -32,8 +46,7 @@ def get_sorted_sectors(assets_df):
     Returns:
         list[str]: Sorted list of known sector names (no 'Uncategorized').
     """
-    sectors = assets_df['sector'].dropna().unique()
-    return sorted(sector for sector in sectors if sector != 'Uncategorized')
+    return _sorted_known_values(assets_df['sector'])
 
 
 def create_frequency_vectors(politicians_df, assets_df, subtypes):
@@ -56,14 +69,10 @@ def create_frequency_vectors(politicians_df, assets_df, subtypes):
         .unstack(fill_value=0)
     )
 
-    # Ensure all politicians appear
+    # Ensure all politicians appear as rows and all subtypes as columns
+    # in deterministic order, aligning both axes in a single pass
     freq_matrix = freq_matrix.reindex(
         index=politicians_df['id'],
-        fill_value=0
-    )
-
-    # Ensure all subtypes appear as columns in deterministic order
-    freq_matrix = freq_matrix.reindex(
         columns=subtypes,
         fill_value=0
     )
@@ -94,14 +103,10 @@ def create_weighted_frequency_vectors(politicians_df, assets_df, subtypes):
         .unstack(fill_value=0)
     )
 
-    # Ensure all politicians appear
+    # Ensure all politicians appear as rows and all subtypes as columns
+    # in deterministic order, aligning both axes in a single pass
     weighted_matrix = weighted_matrix.reindex(
         index=politicians_df['id'],
-        fill_value=0
-    )
-
-    # Ensure all subtypes appear as columns in deterministic order
-    weighted_matrix = weighted_matrix.reindex(
         columns=subtypes,
         fill_value=0
     )
@@ -134,15 +139,10 @@ def create_sector_frequency_vectors(politicians_df, assets_df, sectors):
         .unstack(fill_value=0)
     )
 
-    # Ensure all politicians appear as rows
+    # Ensure all politicians appear as rows and reindex to known sectors
+    # only (drops 'Uncategorized'), aligning both axes in a single pass
     sector_matrix = sector_matrix.reindex(
         index=politicians_df['id'],
-        fill_value=0
-    )
-
-    # Reindex to known sectors only
-    # Drops 'Uncategorized'
-    sector_matrix = sector_matrix.reindex(
         columns=sectors,
         fill_value=0
     )
@@ -164,11 +164,14 @@ def compute_numerical_features(freq_matrix):
     Returns:
         pd.DataFrame: Shape (n_politicians, 2), indexed by politician_id
     """
+    # Row reductions on the underlying array, without a boolean DataFrame
+    values = freq_matrix.to_numpy()
+
     # Sum of each row in freq_matrix
-    total_assets = freq_matrix.sum(axis=1)
+    total_assets = values.sum(axis=1)
 
-    # Count of non-zero values per row
-    diversity = (freq_matrix > 0).sum(axis=1)
+    # Count of non-zero values per row (counts are never negative)
+    diversity = np.count_nonzero(values, axis=1)
 
     numerical_features = pd.DataFrame({
         'total_assets': total_assets,
@@ -203,8 +206,9 @@ def analyze_sparsity(matrix, name="matrix"):
     """
     # Total number of values
     total_cells = matrix.size
-    # Number of zero values
-    zero_cells = (matrix.values == 0).sum()
+    # Number of zero values; count_nonzero avoids building a full boolean
+    # copy of the matrix just to count its zeros
+    zero_cells = total_cells - np.count_nonzero(matrix.to_numpy())
     # Percentage of zeros
     sparsity = (zero_cells / total_cells) * 100
 
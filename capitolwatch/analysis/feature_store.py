@@ -5,23 +5,31 @@
 """
 Feature store: serialization and loading of computed feature matrices.
 
-All matrices are saved as raw DataFrames.
+All matrices are saved as raw DataFrames (joblib, zlib-compressed).
 
 Store layout:
     data/outputs/
     ├── freq_baseline.pkl      -- subtyp frequency vectors + numerical features
     ├── freq_weighted.pkl      -- subtype weighted vectors + numerical features
     ├── sector_baseline.pkl    -- sector frequency vectors + numerical features
-    └── politician_labels.pkl  -- id, first_name, last_name, party
+    ├── politician_labels.pkl  -- id, first_name, last_name, party
+    └── feature_store_manifest.json -- store version and database state the
+                                       store was built from
 
 Main functions:
-    - build_feature_store() : compute all matrices and persist them
+    - build_feature_store() : compute all matrices and persist them, unless
+      the store is already up to date with the database
     - load_features(feature_type) : load one matrix from disk
 """
 
+import json
+from functools import lru_cache
+
 import joblib
 from pathlib import Path
 
+from config import CONFIG
+from capitolwatch.db import get_connection
 from capitolwatch.analysis.data_loader import (
     load_politicians, load_assets_with_products
 )
@@ -44,22 +52,73 @@ FEATURE_FILES = {
     "politician_labels": FEATURE_STORE_DIR / "politician_labels.pkl",
 }
 
+MANIFEST_FILE = FEATURE_STORE_DIR / "feature_store_manifest.json"
+
+# Recorded in the manifest; bump it whenever the feature engineering
+# changes so existing stores are rebuilt instead of silently reused
+FEATURE_STORE_VERSION = 1
+
+
+# zlib level 3: much smaller files for the sparse count matrices at a
+# negligible (de)compression cost; joblib.load detects it automatically
+COMPRESSION = 3
+
 
 def _save(obj, path):
     """
-    Serialize obj to disk using joblib.
+    Serialize obj to disk using joblib with zlib compression.
 
     Args:
         obj: Any Python object (DataFrame, dict, …).
         path (Path): Destination file path.
     """
-    joblib.dump(obj, path)
+    joblib.dump(obj, path, compress=COMPRESSION)
 
 
-def build_feature_store():
+def _database_fingerprint():
+    """
+    Identify the current state of the database file and feature code.
+
+    Returns:
+        dict: Store version, database path, size and modification time
+            (ns).
+    """
+    stat = Path(CONFIG.db_path).stat()
+    return {
+        "version": FEATURE_STORE_VERSION,
+        "db_path": str(CONFIG.db_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def is_feature_store_current():
+    """
+    Check whether the stored matrices were built from the current database.
+
+    A couple of file stats, instead of reloading and recomputing every
+    matrix from the database.
+
+    Returns:
+        bool: True if every store file exists and the manifest matches the
+            database fingerprint.
+    """
+    if not all(path.exists() for path in FEATURE_FILES.values()):
+        return False
+    try:
+        manifest = json.loads(MANIFEST_FILE.read_text())
+        return manifest == _database_fingerprint()
+    except (OSError, ValueError):
+        return False
+
+
+def build_feature_store(force=False):
     """
     Compute all feature matrices and store them to data/outputs/.
 
+    The build is skipped when the store is already up to date with the
+    database (see is_feature_store_current), unless force is True.
+
     Steps:
         1. Load politicians + assets from the database
         2. Build freq_baseline (subtype frequency vectors + numerical features)
@@ -67,12 +126,29 @@ def build_feature_store():
         4. Build sectorbaseline (sector frequency vectors + numerical features)
         5. Save each matrix as a .pkl file
         6. Save politician_labels (id, first_name, last_name, party)
+        7. Record the database fingerprint in the manifest
+
+    Args:
+        force (bool): Rebuild even if the store is up to date.
+
+    Returns:
+        bool: True if the store was rebuilt, False if it was up to date.
     """
+    if not force and is_feature_store_current():
+        print("Feature store is up to date with the database, skipping")
+        return False
+
     FEATURE_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    # Taken before reading so a database changed mid-build is rebuilt next
+    fingerprint = _database_fingerprint()
 
-    # Step 1 – load raw data
-    politicians = load_politicians()
-    assets = load_assets_with_products()
+    # Step 1 – load raw data over a single connection
+    connection = get_connection(CONFIG)
+    try:
+        politicians = load_politicians(connection=connection)
+        assets = load_assets_with_products(connection=connection)
+    finally:
+        connection.close()
     subtypes = get_sorted_subtypes(assets)
     sectors = get_sorted_sectors(assets)
 
@@ -108,17 +184,38 @@ def build_feature_store():
     ].copy()
     _save(politician_labels, FEATURE_FILES["politician_labels"])
 
+    # Step 7 – record which database state the store reflects
+    MANIFEST_FILE.write_text(json.dumps(fingerprint))
+    return True
 
-def load_features(feature_type):
+
+@lru_cache(maxsize=8)
+def _read_matrix(path, mtime_ns):
     """
-    Load a feature matrix from the store.
+    Read and decompress one store file, cached per process.
+
+    The modification time is part of the cache key, so a rebuilt file is
+    read again instead of being served from the cache.
 
     Args:
-        feature_type (str): One of "freq_baseline", "freq_weighted",
-                            "politician_labels".
+        path (Path): Store file to read.
+        mtime_ns (int): Modification time of the file, in nanoseconds.
 
     Returns:
-        pd.DataFrame: The stored feature matrix.
+        pd.DataFrame: The stored matrix, shared by all cache hits.
+    """
+    return joblib.load(path)
+
+
+def _feature_path(feature_type):
+    """
+    Return the store file of a feature type, checking that it exists.
+
+    Args:
+        feature_type (str): Key of FEATURE_FILES.
+
+    Returns:
+        Path: The store file.
     """
     if feature_type not in FEATURE_FILES:
         raise KeyError(
@@ -132,8 +229,42 @@ def load_features(feature_type):
             f"Feature store not found at {path}. "
             "Run build_feature_store() first."
         )
+    return path
 
-    return joblib.load(path)
+
+def get_feature_version(feature_type):
+    """
+    Return a token that changes whenever a store file is rewritten.
+
+    Callers that cache values derived from a matrix include it in their
+    cache key, so a rebuilt store is picked up without a restart.
+
+    Args:
+        feature_type (str): One of "freq_baseline", "freq_weighted",
+                            "politician_labels".
+
+    Returns:
+        int: Modification time of the file, in nanoseconds.
+    """
+    return _feature_path(feature_type).stat().st_mtime_ns
+
+
+def load_features(feature_type):
+    """
+    Load a feature matrix from the store.
+
+    Each file is decompressed once per process; callers get their own copy
+    so they can modify it freely.
+
+    Args:
+        feature_type (str): One of "freq_baseline", "freq_weighted",
+                            "politician_labels".
+
+    Returns:
+        pd.DataFrame: The stored feature matrix.
+    """
+    path = _feature_path(feature_type)
+    return _read_matrix(path, path.stat().st_mtime_ns).copy()
 
 
 if __name__ == "__main__":
@@ -12,16 +12,17 @@ Usage:
     python -m capitolwatch.analysis.run_cluster_analysis
 """
 
-from capitolwatch.analysis.cluster_analysis import run_analysis
+from capitolwatch.analysis.cluster_analysis import (
+    compute_politician_stats,
+    run_analysis,
+)
 from capitolwatch.analysis.data_loader import (
     load_assets_with_products,
     load_politicians,
 )
-from capitolwatch.analysis.run_evaluation import (
-    _get_dbscan_labels,
-    _get_kmeans_labels,
-    _get_som_labels,
-)
+from capitolwatch.analysis.run_evaluation import _build_experiment_configs
+from capitolwatch.db import get_connection
+from config import CONFIG
 
 
 def run_all_analyses(
@@ -44,25 +45,26 @@ def run_all_analyses(
 
     out_path = Path(output_dir)
 
-    # Load the raw data once
+    # Load the raw data once, over a single connection
     print("Loading raw data from database")
-    politicians_df = load_politicians()
-    assets_df = load_assets_with_products()
+    connection = get_connection(CONFIG)
+    try:
+        politicians_df = load_politicians(connection=connection)
+        assets_df = load_assets_with_products(connection=connection)
+    finally:
+        connection.close()
     print(f"  Politicians: {len(politicians_df)} | Assets: {len(assets_df)}")
 
-    experiments = [
-        ("kmeans", "freq_baseline", _get_kmeans_labels),
-        ("kmeans", "freq_weighted", _get_kmeans_labels),
-        ("dbscan", "freq_baseline", _get_dbscan_labels),
-        ("dbscan", "freq_weighted", _get_dbscan_labels),
-        ("som", "freq_baseline", _get_som_labels),
-        ("som", "freq_weighted", _get_som_labels),
-    ]
+    # Per-politician totals and diversity do not depend on the clustering
+    politician_stats = compute_politician_stats(assets_df)
 
     all_profiles = {}
 
-    for algo_name, feature_type, loader_fn in experiments:
-        _, labels = loader_fn(feature_type)
+    # Labels come from the experiment cache shared with the evaluation step
+    for cfg in _build_experiment_configs():
+        algo_name = cfg["algo"]
+        feature_type = cfg["feature_type"]
+        _, labels = cfg["loader"]()
 
         profiles = run_analysis(
             labels=labels,
@@ -71,6 +73,7 @@ def run_all_analyses(
             algo_name=algo_name,
             feature_type=feature_type,
             output_dir=out_path,
+            politician_stats=politician_stats,
         )
         all_profiles[f"{algo_name}/{feature_type}"] = profiles
 
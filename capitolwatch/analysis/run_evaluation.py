@@ -22,6 +22,8 @@ Usage:
     python -m capitolwatch.analysis.run_evaluation
 """
 
+from functools import lru_cache, partial
+
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import MinMaxScaler, StandardScaler
@@ -33,10 +35,64 @@ from capitolwatch.analysis.evaluation import (
     evaluate_clustering_external,
     export_results,
 )
-from capitolwatch.analysis.feature_store import load_features
+from capitolwatch.analysis.feature_store import (
+    get_feature_version,
+    load_features,
+)
 from capitolwatch.analysis.preprocessing import normalize_features
 
 
+_SCALERS = {"standard": StandardScaler, "minmax": MinMaxScaler}
+
+# Party integer encoding used as ground truth for the external metrics
+_PARTY_ORDER = ["Republican", "Democratic", "Independent"]
+
+
+def _load_scaled(feature_type: str, scaler_name: str) -> np.ndarray:
+    """
+    Load a feature matrix and normalize it, once per store version.
+
+    Every experiment, and every pipeline step (evaluate, analyze,
+    visualize), needs the same scaled matrices; caching them avoids
+    reloading the pickle and refitting the scaler each time. The store
+    file version is part of the cache key, so a rebuilt store is scaled
+    again. The returned array is read-only because it is shared between
+    callers.
+
+    Args:
+        feature_type (str): Key in the feature store (e.g. "freq_baseline").
+        scaler_name (str): "standard" or "minmax".
+
+    Returns:
+        np.ndarray: Scaled feature matrix of shape (n_samples, n_features).
+    """
+    return _scale_features(
+        feature_type, scaler_name, get_feature_version(feature_type)
+    )
+
+
+@lru_cache(maxsize=8)
+def _scale_features(
+    feature_type: str, scaler_name: str, version: int
+) -> np.ndarray:
+    """
+    Cached body of _load_scaled.
+
+    Args:
+        feature_type (str): Key in the feature store.
+        scaler_name (str): "standard" or "minmax".
+        version (int): Store file version, only used as a cache key.
+
+    Returns:
+        np.ndarray: Read-only scaled feature matrix.
+    """
+    matrix = load_features(feature_type)
+    scaled, _ = normalize_features(matrix, _SCALERS[scaler_name]())
+    X = scaled.to_numpy()
+    X.setflags(write=False)
+    return X
+
+
 def _load_standard(feature_type: str) -> np.ndarray:
     """
     Load a feature matrix and apply StandardScaler.
@@ -47,9 +103,7 @@ def _load_standard(feature_type: str) -> np.ndarray:
     Returns:
         np.ndarray: Scaled feature matrix of shape (n_samples, n_features).
     """
-    matrix = load_features(feature_type)
-    scaled, _ = normalize_features(matrix, StandardScaler())
-    return scaled.to_numpy()
+    return _load_scaled(feature_type, "standard")
 
 
 def _load_minmax(feature_type: str) -> np.ndarray:
@@ -62,9 +116,7 @@ def _load_minmax(feature_type: str) -> np.ndarray:
     Returns:
         np.ndarray: Scaled feature matrix of shape (n_samples, n_features).
     """
-    matrix = load_features(feature_type)
-    scaled, _ = normalize_features(matrix, MinMaxScaler())
-    return scaled.to_numpy()
+    return _load_scaled(feature_type, "minmax")
 
 
 def _get_kmeans_labels(feature_type: str, k_range: tuple = (2, 15)) -> tuple:
@@ -122,7 +174,7 @@ def _get_dbscan_labels(
         tuple: (X: np.ndarray, labels: np.ndarray)
     """
     from sklearn.cluster import DBSCAN
-    from sklearn.metrics import silhouette_score
+    from sklearn.metrics import pairwise_distances, silhouette_score
 
     if eps_values is None:
         eps_values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
@@ -132,11 +184,17 @@ def _get_dbscan_labels(
     X = _load_standard(feature_type)
     n_total = len(X)
 
+    # every configuration needs the same pairwise distances (cosine for
+    # DBSCAN, euclidean for the silhouette): compute both matrices once
+    # for the whole grid instead of once per configuration
+    cosine_dist = pairwise_distances(X, metric="cosine")
+    euclidean_dist = pairwise_distances(X)
+
     candidates = []
     for eps in eps_values:
         for min_s in min_samples_values:
-            db = DBSCAN(eps=eps, min_samples=min_s, metric="cosine")
-            labels = db.fit_predict(X)
+            db = DBSCAN(eps=eps, min_samples=min_s, metric="precomputed")
+            labels = db.fit_predict(cosine_dist)
             n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
             n_outliers = int(np.sum(labels == -1))
 
@@ -148,7 +206,11 @@ def _get_dbscan_labels(
             if mask.sum() < 2 or len(np.unique(labels[mask])) < 2:
                 continue
 
-            sil = silhouette_score(X[mask], labels[mask])
+            sil = silhouette_score(
+                euclidean_dist[np.ix_(mask, mask)],
+                labels[mask],
+                metric="precomputed",
+            )
             candidates.append(
                 {
                     "eps": eps,
@@ -210,6 +272,68 @@ def _get_som_labels(
     return X, clusterer.labels_.astype(int)
 
 
+_LABEL_GETTERS = {
+    "kmeans": _get_kmeans_labels,
+    "dbscan": _get_dbscan_labels,
+    "som": _get_som_labels,
+}
+
+# (algo, feature_type) -> (version, X, labels), filled by
+# _get_experiment_labels; version is the store file version it was fitted on
+_experiment_cache: dict = {}
+
+
+def _store_experiment(key: tuple, version: int, result: tuple) -> tuple:
+    """
+    Cache the (X, labels) pair of one experiment and return it.
+
+    The labels are made read-only because the cached array is shared by
+    every caller (evaluation, analysis and visualization steps).
+
+    Args:
+        key (tuple): (algo, feature_type).
+        version (int): Store file version the experiment was fitted on.
+        result (tuple): (X, labels) returned by the label getter.
+
+    Returns:
+        tuple: The cached (X, labels) pair.
+    """
+    X, labels = result
+    labels.setflags(write=False)
+    _experiment_cache[key] = (version, X, labels)
+    return X, labels
+
+
+def _get_experiment_labels(
+    algo: str,
+    feature_type: str,
+    force: bool = False,
+) -> tuple:
+    """
+    Fit one experiment, or return its cached (X, labels) pair.
+
+    All algorithms are seeded, so refitting the same experiment gives the
+    same labels; a full pipeline run therefore fits each one only once.
+    A cached experiment is refitted when its store file was rebuilt.
+
+    Args:
+        algo (str): "kmeans", "dbscan" or "som".
+        feature_type (str): Key in the feature store.
+        force (bool): Refit even if the experiment is already cached.
+
+    Returns:
+        tuple: (X: np.ndarray, labels: np.ndarray)
+    """
+    key = (algo, feature_type)
+    version = get_feature_version(feature_type)
+    cached = _experiment_cache.get(key)
+    if force or cached is None or cached[0] != version:
+        return _store_experiment(
+            key, version, _LABEL_GETTERS[algo](feature_type)
+        )
+    return cached[1:]
+
+
 def _build_experiment_configs() -> list:
     """
     Return the list of (algo_name, feature_type, loader_fn) triples.
@@ -220,35 +344,12 @@ def _build_experiment_configs() -> list:
     """
     return [
         {
-            "algo": "kmeans",
-            "feature_type": "freq_baseline",
-            "loader": lambda: _get_kmeans_labels("freq_baseline"),
-        },
-        {
-            "algo": "kmeans",
-            "feature_type": "freq_weighted",
-            "loader": lambda: _get_kmeans_labels("freq_weighted"),
-        },
-        {
-            "algo": "dbscan",
-            "feature_type": "freq_baseline",
-            "loader": lambda: _get_dbscan_labels("freq_baseline"),
-        },
-        {
-            "algo": "dbscan",
-            "feature_type": "freq_weighted",
-            "loader": lambda: _get_dbscan_labels("freq_weighted"),
-        },
-        {
-            "algo": "som",
-            "feature_type": "freq_baseline",
-            "loader": lambda: _get_som_labels("freq_baseline"),
-        },
-        {
-            "algo": "som",
-            "feature_type": "freq_weighted",
-            "loader": lambda: _get_som_labels("freq_weighted"),
-        },
+            "algo": algo,
+            "feature_type": feature_type,
+            "loader": partial(_get_experiment_labels, algo, feature_type),
+        }
+        for algo in ("kmeans", "dbscan", "som")
+        for feature_type in ("freq_baseline", "freq_weighted")
     ]
 
 
@@ -315,11 +416,12 @@ def print_comparison_table(df: pd.DataFrame) -> None:
     }
     display = df.rename(columns=col_fmt)
 
-    # format float columns to 4 decimal places
-    for col in ["Silhouette"]:
-        display[col] = display[col].apply(
-            lambda v: f"{v:.4f}" if not pd.isna(v) else "nan"
-        )
+    # format float columns to 4 decimal places; casting once turns None
+    # into NaN, which formats as "nan" without a per-value check
+    float_cols = ["Silhouette"]
+    display[float_cols] = (
+        display[float_cols].astype(float).map("{:.4f}".format)
+    )
 
     print(display.to_string(index=False))
 
@@ -334,10 +436,9 @@ def _load_party_labels() -> np.ndarray:
         np.ndarray: Integer array of shape (n_politicians,).
     """
     labels_df = load_features("politician_labels")
-    party_map = {"Republican": 0, "Democratic": 1, "Independent": 2}
-    # map returns NaN for unknown values : fill with -1 as a safe fallback
-    encoded = labels_df["party"].map(party_map).fillna(-1).astype(int)
-    return encoded.to_numpy()
+    # get_indexer returns each party's position directly as an integer
+    # array, with -1 for unknown values as a safe fallback
+    return pd.Index(_PARTY_ORDER).get_indexer(labels_df["party"])
 
 
 def run_external_evaluations(
@@ -437,10 +538,10 @@ def print_external_comparison_table(df: pd.DataFrame) -> None:
         "v_measure": "V-Measure",
     }
     display = df.rename(columns=col_fmt)
-    for col in ["ARI", "NMI", "V-Measure"]:
-        display[col] = display[col].apply(
-            lambda v: f"{v:.4f}" if not pd.isna(v) else "nan"
-        )
+    float_cols = ["ARI", "NMI", "V-Measure"]
+    display[float_cols] = (
+        display[float_cols].astype(float).map("{:.4f}".format)
+    )
     print(display.to_string(index=False))
 
 
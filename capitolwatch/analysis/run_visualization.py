@@ -48,6 +48,8 @@ def run_simple_plots(output_dir: Path = OUTPUT_DIR) -> None:
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     configs = _build_experiment_configs()
+    # Each feature type is shared by three experiments: read it once
+    raw_matrices = {}
 
     for cfg in configs:
         algo = cfg["algo"]
@@ -55,11 +57,13 @@ def run_simple_plots(output_dir: Path = OUTPUT_DIR) -> None:
         label = f"{algo} / {feature_type}"
         print(f"  {label}")
 
-        # Re-fit the algorithm to get cluster labels.
+        # Fit the algorithm (or reuse the labels cached by an earlier step).
         _, labels = cfg["loader"]()
 
         # Load raw (unscaled) feature matrix so heatmap values are readable.
-        raw_matrix = load_features(feature_type)
+        if feature_type not in raw_matrices:
+            raw_matrices[feature_type] = load_features(feature_type)
+        raw_matrix = raw_matrices[feature_type]
         feature_names = list(raw_matrix.columns)
         X_raw = raw_matrix.to_numpy()
 
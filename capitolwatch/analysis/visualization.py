@@ -131,18 +131,26 @@ def plot_centroid_heatmap(
     # Drop engineered numeric meta-features : they are on a different scale
     # and would crush the color range, hiding the subtype signal.
     META_FEATURES = {"total_assets", "diversity"}
-    subtype_names = [f for f in feature_names if f not in META_FEATURES]
-
-    # Build a DataFrame to leverage groupby easily.
-    df = pd.DataFrame(feature_matrix, columns=feature_names)
-    df["_label"] = labels
+    subtype_cols = [
+        i for i, f in enumerate(feature_names) if f not in META_FEATURES
+    ]
+    subtype_names = [feature_names[i] for i in subtype_cols]
 
     # Exclude outliers : their "centroid" is not meaningful.
-    df = df[df["_label"] != -1]
-
-    # Compute mean of each subtype column per cluster.
-    centroid_df = df.groupby("_label")[subtype_names].mean()
-    centroid_df.index = [f"Cluster {i}" for i in centroid_df.index]
+    labels = np.asarray(labels)
+    keep = labels != -1
+    cluster_ids, members = np.unique(labels[keep], return_inverse=True)
+
+    # Accumulate each politician's row into its cluster's subtype sums in
+    # one pass, then divide once by the cluster sizes to get the means.
+    subtype_values = np.asarray(feature_matrix, dtype=float)[keep]
+    cluster_sums = np.zeros((len(cluster_ids), len(subtype_cols)))
+    np.add.at(cluster_sums, members, subtype_values[:, subtype_cols])
+    centroid_df = pd.DataFrame(
+        cluster_sums / np.bincount(members)[:, np.newaxis],
+        index=[f"Cluster {i}" for i in cluster_ids],
+        columns=subtype_names,
+    )
 
     # Wider figure when there are many features (e.g. 38 subtypes).
     fig_width = max(14, len(feature_names) * 0.4)
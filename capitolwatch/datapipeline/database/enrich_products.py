@@ -12,8 +12,9 @@ import re
 import json
 import requests
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 from config import CONFIG
 from capitolwatch.db import get_connection
@@ -26,6 +27,19 @@ from capitolwatch.datapipeline.database.geographic_enrichment import (
 )
 
 
+# "TICKER - Description" or "TICKER-Description", compiled once
+_TICKER_RE = re.compile(r'^([A-Z]{1,5})\s*-\s*.+')
+
+# OpenFIGI accepts up to 100 mapping jobs per request with an API key,
+# and only 10 without one
+OPENFIGI_BATCH_SIZE = 100
+OPENFIGI_BATCH_SIZE_NO_KEY = 10
+
+# Concurrent Yahoo Finance lookups; each one is a blocking HTTP call.
+# Kept low because Yahoo throttles bursts of requests
+YAHOO_MAX_WORKERS = 4
+
+
 # ---------- Product Type Filtering ----------
 # Relevant types for financial investment analysis
 # These products have enrichable data (ticker, sector, etc.)
@@ -88,6 +102,12 @@ EXCLUDED_PRODUCT_TYPES = {
 }
 
 
+# ---------- Risk Classification ----------
+CONSERVATIVE_ASSET_CLASSES = {'Cash', 'Money Market'}
+CONSERVATIVE_SECTORS = {'Utilities', 'Consumer Staples'}
+AGGRESSIVE_SECTORS = {'Technology', 'Biotechnology', 'Energy'}
+
+
 def is_product_analyzable(product_type: str) -> bool:
     """
     Determines if a product type is relevant for analysis.
@@ -125,8 +145,7 @@ def extract_ticker(name: str) -> Optional[str]:
         return None
 
     # Main pattern: "TICKER - Description" or "TICKER-Description"
-    pattern = r'^([A-Z]{1,5})\s*-\s*.+'
-    match = re.match(pattern, name)
+    match = _TICKER_RE.match(name)
     if match:
         ticker = match.group(1)
         # Validation: 1-5 alphabetic characters
@@ -153,6 +172,88 @@ def get_openfigi_session(api_key: str) -> requests.Session:
     return session
 
 
+def get_openfigi_batch_size(session: requests.Session) -> int:
+    """
+    Returns the number of mapping jobs OpenFIGI accepts per request.
+
+    Args:
+        session (requests.Session): Configured HTTP session.
+    Returns:
+        int: Batch size allowed with or without an API key.
+    """
+    if session.headers.get('X-OPENFIGI-APIKEY'):
+        return OPENFIGI_BATCH_SIZE
+    return OPENFIGI_BATCH_SIZE_NO_KEY
+
+
+def _parse_openfigi_job(job: Dict) -> Optional[Dict]:
+    """
+    Extracts the first match of one OpenFIGI mapping job result.
+
+    Args:
+        job (Dict): One element of the OpenFIGI mapping response.
+    Returns:
+        Optional[Dict]: FIGI data or None if the job found no match.
+    """
+    if not job or not job.get('data'):
+        return None
+
+    data = job['data'][0]
+    return {
+        'figi': data.get('figi'),
+        'ticker': data.get('ticker'),
+        'exchange': data.get('exchCode'),
+        'security_type': data.get('securityType'),
+        'market_sector': data.get('marketSector')
+    }
+
+
+def get_openfigi_security_info_batch(
+    session: requests.Session,
+    tickers: List[str]
+) -> Dict[str, Optional[Dict]]:
+    """
+    Retrieves security information from OpenFIGI for several tickers.
+
+    Tickers are sent as many at a time as the session's API key allows,
+    one mapping job per ticker, so a batch costs a single HTTP round-trip.
+    Tickers of a failed request are left out of the result so callers
+    can fall back to per-ticker lookups.
+
+    Args:
+        session (requests.Session): Configured HTTP session.
+        tickers (List[str]): Ticker symbols.
+    Returns:
+        Dict[str, Optional[Dict]]: FIGI data (or None) keyed by ticker.
+    """
+    url = "https://api.openfigi.com/v3/mapping"
+    batch_size = get_openfigi_batch_size(session)
+    results = {}
+
+    for start in range(0, len(tickers), batch_size):
+        batch = tickers[start:start + batch_size]
+        query = [
+            {"idType": "TICKER", "idValue": ticker, "exchCode": "US"}
+            for ticker in batch
+        ]
+
+        try:
+            response = session.post(url, data=json.dumps(query))
+            response.raise_for_status()
+            jobs = response.json() or []
+        except Exception as e:
+            print(f"  Error querying OpenFIGI for {len(batch)} tickers: {e}")
+            continue
+
+        # Jobs come back in request order; missing ones map to None
+        for i, ticker in enumerate(batch):
+            results[ticker] = (
+                _parse_openfigi_job(jobs[i]) if i < len(jobs) else None
+            )
+
+    return results
+
+
 def get_openfigi_security_info(
     session: requests.Session,
     ticker: str
@@ -166,29 +267,39 @@ def get_openfigi_security_info(
     Returns:
         Optional[Dict]: FIGI data or None.
     """
-    url = "https://api.openfigi.com/v3/mapping"
-    query = [{"idType": "TICKER", "idValue": ticker, "exchCode": "US"}]
+    return get_openfigi_security_info_batch(session, [ticker]).get(ticker)
 
-    try:
-        response = session.post(url, data=json.dumps(query))
-        response.raise_for_status()
-        result = response.json()
-        if (result and len(result) > 0 and
-                'data' in result[0] and result[0]['data']):
-            data = result[0]['data'][0]
-            return {
-                'figi': data.get('figi'),
-                'ticker': data.get('ticker'),
-                'exchange': data.get('exchCode'),
-                'security_type': data.get('securityType'),
-                'market_sector': data.get('marketSector')
-            }
-        return None
 
-    except Exception as e:
-        print(f"  Error querying OpenFIGI for {ticker}: {e}")
+def _fetch_yahoo_security_info(ticker: str) -> Optional[Dict]:
+    """
+    Fetches financial information from Yahoo Finance, raising on errors.
+
+    Args:
+        ticker (str): Ticker symbol.
+    Returns:
+        Optional[Dict]: Yahoo Finance data or None if Yahoo has none.
+    """
+    stock = yf.Ticker(ticker)
+    info = stock.info
+    if not info or 'symbol' not in info:
         return None
 
+    return {
+        'symbol': info.get('symbol'),
+        'name': info.get('longName') or info.get('shortName'),
+        'sector': info.get('sector'),
+        'industry': info.get('industry'),
+        'country': info.get('country'),
+        'currency': info.get('currency'),
+        'market_cap': info.get('marketCap'),
+        'beta': info.get('beta'),
+        'dividend_yield': info.get('dividendYield'),
+        'expense_ratio': info.get('annualReportExpenseRatio'),
+        'asset_class_yahoo': info.get('quoteType'),
+        'fund_family': info.get('fundFamily'),
+        'category': info.get('category')
+    }
+
 
 def get_yahoo_security_info(ticker: str) -> Optional[Dict]:
     """
@@ -200,32 +311,48 @@ def get_yahoo_security_info(ticker: str) -> Optional[Dict]:
         Optional[Dict]: Yahoo Finance data or None.
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        if not info or 'symbol' not in info:
-            return None
-
-        return {
-            'symbol': info.get('symbol'),
-            'name': info.get('longName') or info.get('shortName'),
-            'sector': info.get('sector'),
-            'industry': info.get('industry'),
-            'country': info.get('country'),
-            'currency': info.get('currency'),
-            'market_cap': info.get('marketCap'),
-            'beta': info.get('beta'),
-            'dividend_yield': info.get('dividendYield'),
-            'expense_ratio': info.get('annualReportExpenseRatio'),
-            'asset_class_yahoo': info.get('quoteType'),
-            'fund_family': info.get('fundFamily'),
-            'category': info.get('category')
-        }
-
+        return _fetch_yahoo_security_info(ticker)
     except Exception as e:
         print(f"  Error querying Yahoo Finance for {ticker}: {e}")
         return None
 
 
+def get_yahoo_security_info_batch(
+    tickers: List[str]
+) -> Dict[str, Optional[Dict]]:
+    """
+    Fetches Yahoo Finance information for several tickers concurrently.
+
+    Each lookup waits on the network, so YAHOO_MAX_WORKERS threads overlap
+    the requests instead of issuing them one after the other. Tickers
+    whose lookup failed (e.g. rate limiting) are left out of the result
+    so callers can fall back to per-ticker lookups.
+
+    Args:
+        tickers (List[str]): Ticker symbols.
+    Returns:
+        Dict[str, Optional[Dict]]: Yahoo Finance data (or None) keyed by
+        ticker.
+    """
+    if not tickers:
+        return {}
+
+    def lookup(ticker):
+        try:
+            return True, _fetch_yahoo_security_info(ticker)
+        except Exception as e:
+            print(f"  Error querying Yahoo Finance for {ticker}: {e}")
+            return False, None
+
+    with ThreadPoolExecutor(max_workers=YAHOO_MAX_WORKERS) as executor:
+        outcomes = executor.map(lookup, tickers)
+        return {
+            ticker: data
+            for ticker, (ok, data) in zip(tickers, outcomes)
+            if ok
+        }
+
+
 def classify_asset_class(openfigi_data: Dict, yahoo_data: Dict) -> str:
     """
     Determines asset class from provided data.
@@ -299,15 +426,13 @@ def calculate_risk_rating(
         str: Risk rating.
     """
     # Conservative assets
-    if asset_class in ['Cash', 'Money Market']:
+    if asset_class in CONSERVATIVE_ASSET_CLASSES:
         return 'Conservative'
     # Sector-based
     if sector:
-        conservative_sectors = ['Utilities', 'Consumer Staples']
-        aggressive_sectors = ['Technology', 'Biotechnology', 'Energy']
-        if sector in conservative_sectors:
+        if sector in CONSERVATIVE_SECTORS:
             return 'Conservative'
-        elif sector in aggressive_sectors:
+        elif sector in AGGRESSIVE_SECTORS:
             return 'Aggressive'
     # Beta-based
     if beta:
@@ -353,7 +478,9 @@ def determine_fund_flags(name: str, asset_class: str) -> Dict[str, bool]:
 
 def enrich_single_product(
     product: Dict,
-    openfigi_session: requests.Session
+    openfigi_session: requests.Session,
+    openfigi_results: Optional[Dict[str, Optional[Dict]]] = None,
+    yahoo_results: Optional[Dict[str, Optional[Dict]]] = None
 ) -> Optional[Dict]:
     """
     Enrich a single product with financial and geographic data.
@@ -361,6 +488,12 @@ def enrich_single_product(
     Args:
         product (Dict): Product dictionary with 'id', 'name', 'type'.
         openfigi_session (requests.Session): OpenFIGI HTTP session.
+        openfigi_results (Optional[Dict]): OpenFIGI data already fetched
+            by ticker (see get_openfigi_security_info_batch). Tickers
+            missing from it are queried individually.
+        yahoo_results (Optional[Dict]): Yahoo Finance data already fetched
+            by ticker (see get_yahoo_security_info_batch). Tickers missing
+            from it are queried individually.
 
     Returns:
         Dict: Enrichment data, or None if product type is excluded.
@@ -409,8 +542,14 @@ def enrich_single_product(
     enrichment['ticker'] = ticker
 
     # --- Financial data retrieval ---
-    openfigi_data = get_openfigi_security_info(openfigi_session, ticker)
-    yahoo_data = get_yahoo_security_info(ticker)
+    if openfigi_results is not None and ticker in openfigi_results:
+        openfigi_data = openfigi_results[ticker]
+    else:
+        openfigi_data = get_openfigi_security_info(openfigi_session, ticker)
+    if yahoo_results is not None and ticker in yahoo_results:
+        yahoo_data = yahoo_results[ticker]
+    else:
+        yahoo_data = get_yahoo_security_info(ticker)
 
     openfigi_success = openfigi_data is not None
     yahoo_success = yahoo_data is not None
@@ -563,11 +702,30 @@ def run_enrichment_pipeline(
     }
 
     # Process each product
+    openfigi_results = {}
+    yahoo_results = {}
     for i, product in enumerate(products, 1):
+        # Resolve the OpenFIGI data of the next batch with batched requests,
+        # and its Yahoo Finance data with concurrent lookups
+        if (i - 1) % OPENFIGI_BATCH_SIZE == 0:
+            batch = products[i - 1:i - 1 + OPENFIGI_BATCH_SIZE]
+            tickers = list(dict.fromkeys(
+                ticker for ticker in (
+                    extract_ticker(p['name']) for p in batch
+                    if is_product_analyzable(p.get('type', ''))
+                ) if ticker
+            ))
+            openfigi_results = get_openfigi_security_info_batch(
+                openfigi_session, tickers
+            )
+            yahoo_results = get_yahoo_security_info_batch(tickers)
+
         print(f"\n[{i}/{len(products)}] {product['name'][:50]}...")
 
         try:
-            enrichment_data = enrich_single_product(product, openfigi_session)
+            enrichment_data = enrich_single_product(
+                product, openfigi_session, openfigi_results, yahoo_results
+            )
 
             if enrichment_data is None:
                 stats['skipped_non_analyzable'] += 1
@@ -5,6 +5,11 @@
 import re
 from capitolwatch.services.politicians import normalize_name
 
+# Patterns compiled once at import; clean_text runs for every table cell
+_WHITESPACE_RE = re.compile(r"\s+")
+_REPORT_YEAR_RE = re.compile(r"Annual Report for (\d{4})")
+_ASSETS_HEADING_RE = re.compile("Part 3. Assets")
+
 
 def extract_politician_name(soup):
     """
@@ -55,7 +60,7 @@ def extract_report_year(soup):
         return None
 
     # Use regex to find a year after 'Annual Report for'
-    match = re.search(r"Annual Report for (\d{4})", title.text)
+    match = _REPORT_YEAR_RE.search(title.text)
     if match:
         return int(match.group(1))
 
@@ -73,7 +78,7 @@ def clean_text(text):
         str or None: The cleaned text, or None.
     """
     # Normalize whitespace and strip leading/trailing commas and spaces
-    text = re.sub(r'\s+', ' ', text).strip(", ")
+    text = _WHITESPACE_RE.sub(' ', text).strip(", ")
     return text if text not in ("", "None") else None
 
 
@@ -157,7 +162,7 @@ def extract_assets(soup):
     assets = []
 
     # Find the <h3> of "Part 3. Assets" title
-    h3 = soup.find("h3", string=re.compile("Part 3. Assets"))
+    h3 = soup.find("h3", string=_ASSETS_HEADING_RE)
     if not h3:
         return assets
 
@@ -7,6 +7,7 @@ Geographic enrichment module for financial products.
 Determines if a product is domestic (US-focused) or international.
 """
 
+import re
 from typing import Optional, Dict
 
 
@@ -39,6 +40,29 @@ US_MANAGER_INTERNATIONAL_FUNDS = [
 ]
 
 
+def _keyword_pattern(keywords: list) -> re.Pattern:
+    """
+    Compile a keyword list into one substring-matching alternation.
+
+    A single search over the lowercased name replaces one `in` scan per
+    keyword; matching is still plain substring containment.
+
+    Args:
+        keywords: Lowercase keywords.
+
+    Returns:
+        re.Pattern: Pattern matching any of the keywords.
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+_INTERNATIONAL_RE = _keyword_pattern(INTERNATIONAL_KEYWORDS)
+_US_MANAGER_INTERNATIONAL_RE = _keyword_pattern(
+    US_MANAGER_INTERNATIONAL_FUNDS
+)
+_US_DOMESTIC_RE = _keyword_pattern(US_DOMESTIC_KEYWORDS)
+
+
 def is_international_fund(name: str) -> bool:
     """
     Check if a fund/ETF name indicates international exposure.
@@ -52,14 +76,8 @@ def is_international_fund(name: str) -> bool:
     if not name:
         return False
 
-    name_lower = name.lower()
-
     # Check for international keywords
-    for keyword in INTERNATIONAL_KEYWORDS:
-        if keyword in name_lower:
-            return True
-
-    return False
+    return _INTERNATIONAL_RE.search(name.lower()) is not None
 
 
 def is_us_manager_international_fund(name: str) -> bool:
@@ -75,13 +93,7 @@ def is_us_manager_international_fund(name: str) -> bool:
     if not name:
         return False
 
-    name_lower = name.lower()
-
-    for keyword in US_MANAGER_INTERNATIONAL_FUNDS:
-        if keyword in name_lower:
-            return True
-
-    return False
+    return _US_MANAGER_INTERNATIONAL_RE.search(name.lower()) is not None
 
 
 def is_us_focused_fund(name: str) -> bool:
@@ -97,14 +109,8 @@ def is_us_focused_fund(name: str) -> bool:
     if not name:
         return False
 
-    name_lower = name.lower()
-
     # Check for US-focused keywords
-    for keyword in US_DOMESTIC_KEYWORDS:
-        if keyword in name_lower:
-            return True
-
-    return False
+    return _US_DOMESTIC_RE.search(name.lower()) is not None
 
 
 def determine_is_domestic(product: Dict) -> Optional[bool]:
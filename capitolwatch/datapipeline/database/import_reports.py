@@ -5,15 +5,19 @@
 import hashlib
 from datetime import datetime, timezone
 from config import CONFIG
+from capitolwatch.db import get_connection
 from capitolwatch.services.reports import (
     add_report,
     update_report_source_file,
-    get_report_by_checksum,
+    get_report_id_by_checksum,
 )
 
 # Minimum file size in KB for valid reports (error pages are smaller)
 MIN_FILE_SIZE_KB = 15
 
+# Characters read per block when computing report checksums
+HASH_BLOCK_CHARS = 1 << 16
+
 
 def import_reports(folder_path, project_root):
     """
@@ -59,11 +63,13 @@ def import_reports(folder_path, project_root):
             error_count += 1
             continue
 
+        # Compute SHA-1 checksum of the HTML content, streamed in blocks so
+        # only one block of one report is held in memory at a time
+        hasher = hashlib.sha1()
         with open(file, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        # Compute SHA-1 checksum of the HTML content
-        checksum = hashlib.sha1(html_content.encode("utf-8")).hexdigest()
+            for block in iter(lambda: f.read(HASH_BLOCK_CHARS), ""):
+                hasher.update(block.encode("utf-8"))
+        checksum = hasher.hexdigest()
 
         # Move to temp name if not already (prevents collision during rename)
         original_name = file.name
@@ -77,48 +83,59 @@ def import_reports(folder_path, project_root):
             'file': file,
             'original_name': original_name,
             'checksum': checksum,
-            'html_content': html_content
         })
 
     # PHASE 2: Process and import files
     imported_count = 0
     skipped_count = 0
 
-    for file_data in files_to_process:
-        file = file_data['file']
-        original_name = file_data['original_name']
-        checksum = file_data['checksum']
+    # One connection for the whole loop: the duplicate probe, insert and
+    # source_file update of a report are committed together
+    connection = get_connection(CONFIG)
+    try:
+        for file_data in files_to_process:
+            file = file_data['file']
+            original_name = file_data['original_name']
+            checksum = file_data['checksum']
+
+            # Check if report already exists
+            existing_id = get_report_id_by_checksum(
+                checksum, connection=connection
+            )
+            if existing_id is not None:
+                print(
+                    f"Report {existing_id} already exists "
+                    f"(skipping {original_name}). Deleting duplicate."
+                )
+                file.unlink()  # Delete the duplicate file
+                skipped_count += 1
+                continue
+
+            # Insert new report with auto-generated ID
+            report_id = add_report(
+                checksum=checksum,
+                source_file="",  # Will be set after rename
+                encoding="utf-8",
+                import_timestamp=datetime.now(timezone.utc).isoformat(),
+                url=None,
+                connection=connection,
+            )
 
-        # Check if report already exists
-        existing = get_report_by_checksum(checksum)
-        if existing:
-            print(
-                f"Report {existing['id']} already exists "
-                f"(skipping {original_name}). Deleting duplicate."
+            # Rename file with the generated ID
+            new_filename = file.parent / f"{report_id}.html"
+            file.rename(new_filename)
+
+            # Update source_file path
+            relative_path = str(new_filename.relative_to(project_root))
+            update_report_source_file(
+                report_id, relative_path, connection=connection
             )
-            file.unlink()  # Delete the duplicate file
-            skipped_count += 1
-            continue
+            connection.commit()
 
-        # Insert new report with auto-generated ID
-        report_id = add_report(
-            checksum=checksum,
-            source_file="",  # Will be set after rename
-            encoding="utf-8",
-            import_timestamp=datetime.now(timezone.utc).isoformat(),
-            url=None,
-        )
-
-        # Rename file with the generated ID
-        new_filename = file.parent / f"{report_id}.html"
-        file.rename(new_filename)
-
-        # Update source_file path
-        relative_path = str(new_filename.relative_to(project_root))
-        update_report_source_file(report_id, relative_path)
-
-        print(f"Report {report_id} imported.")
-        imported_count += 1
+            print(f"Report {report_id} imported.")
+            imported_count += 1
+    finally:
+        connection.close()
 
     print(
         f"Import finished: {imported_count} imported, "
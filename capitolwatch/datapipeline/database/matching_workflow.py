@@ -5,6 +5,7 @@
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Dict
 
@@ -13,7 +14,10 @@ from bs4 import BeautifulSoup
 from capitolwatch.datapipeline.database.politician_matcher import (
     match_politician
 )
-from capitolwatch.services.reports import update_report_fields
+from capitolwatch.services.reports import (
+    get_matched_politician_ids,
+    update_report_fields,
+)
 from capitolwatch.services.politicians import get_politician_basic_info
 from capitolwatch.db import get_connection
 from capitolwatch.datapipeline.database.extractor import (
@@ -24,10 +28,14 @@ from config import CONFIG
 
 
 # NameMatching integration
+@lru_cache(maxsize=1)
 def setup_namematching():
     """
     Setup NameMatching module by adding it to the Python path.
 
+    Resolved once per process: every name comparison reuses the loaded
+    module (or the known absence of it) instead of retrying the import.
+
     Returns:
         The namematching module if available, None otherwise.
     """
@@ -36,7 +44,9 @@ def setup_namematching():
         namematching_path = (
             Path(CONFIG.data_dir).parent.parent / "NameMatching"
         )
-        if namematching_path.exists():
+        if namematching_path.exists() and (
+            str(namematching_path) not in sys.path
+        ):
             sys.path.insert(0, str(namematching_path))
 
         import namematching
@@ -308,6 +318,10 @@ def main() -> dict:
     cur = conn.cursor()
 
     try:
+        # Reports already linked to a politician, fetched in one query
+        # instead of one lookup per file
+        matched_reports = get_matched_politician_ids(connection=conn)
+
         for filename in sorted(os.listdir(reports_dir)):
             # Skip non-HTML
             if not filename.endswith(".html"):
@@ -316,15 +330,11 @@ def main() -> dict:
             # Check if report already has a politician_id assigned
             report_id = parse_report_id(filename)
             if report_id is not None:
-                cur.execute(
-                    "SELECT politician_id FROM reports WHERE id = ?",
-                    (report_id,)
-                )
-                row = cur.fetchone()
-                if row and row["politician_id"]:
+                matched_id = matched_reports.get(report_id)
+                if matched_id:
                     print(
                         f"{filename}: Already matched to "
-                        f"{row['politician_id']} (skipping)."
+                        f"{matched_id} (skipping)."
                     )
                     stats["skipped"] += 1
                     stats["processed"] += 1
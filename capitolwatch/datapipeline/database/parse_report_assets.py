@@ -52,13 +52,20 @@ def sort_key(asset: dict) -> tuple:
         return (float("inf"),)
 
 
-def process_assets_parsing(html_file_path: str) -> Optional[str]:
+def process_assets_parsing(
+    html_file_path: str,
+    product_ids: Optional[dict] = None,
+) -> Optional[str]:
     """
     Parse a stored HTML report, extract assets, ensure products exist,
     and insert assets with parent-child relationships.
 
     Args:
         html_file_path: Path to the HTML report to process.
+        product_ids: Optional (name, type) -> product_id cache shared
+            across reports. The same holdings appear in many reports, so
+            known products skip the add_product lookup. Updated with this
+            report's products once its transaction is committed.
 
     Returns:
         A status string like "inserted: <count>"; or None on fatal error.
@@ -95,6 +102,11 @@ def process_assets_parsing(html_file_path: str) -> Optional[str]:
         # Map: extracted index (e.g., "3.1") -> inserted asset_id
         index_to_id: dict[str, int] = {}
         inserted = 0
+        # products resolved for this report, published to product_ids
+        # only after commit so a rolled-back insert is never cached
+        if product_ids is None:
+            product_ids = {}
+        new_product_ids: dict[tuple, int] = {}
 
         for asset in assets_sorted:
             name = (asset.get("name") or "").strip()
@@ -104,16 +116,22 @@ def process_assets_parsing(html_file_path: str) -> Optional[str]:
                 continue  # skip nameless rows
 
             # 1) Ensure product exists and get product_id
-            product_data = {
-                "name": name,
-                "type": product_type,
-                "subtype": product_subtype,
-            }
-            product_id = add_product(
-                product_data,
-                connection=conn,
-                config=CONFIG,
-            )
+            product_key = (name, product_type)
+            product_id = product_ids.get(product_key)
+            if product_id is None:
+                product_id = new_product_ids.get(product_key)
+            if product_id is None:
+                product_data = {
+                    "name": name,
+                    "type": product_type,
+                    "subtype": product_subtype,
+                }
+                product_id = add_product(
+                    product_data,
+                    connection=conn,
+                    config=CONFIG,
+                )
+                new_product_ids[product_key] = product_id
 
             # 2) Resolve parent asset id
             parent_idx = asset.get("parent_index")
@@ -148,6 +166,7 @@ def process_assets_parsing(html_file_path: str) -> Optional[str]:
             inserted += 1
 
         conn.commit()
+        product_ids.update(new_product_ids)
         status = f"inserted: {inserted}"
         print(f"Report {report_id}: {status}")
         return status
@@ -170,12 +189,14 @@ def process_reports_assets(folder_path: str) -> None:
     processed = 0
     succeeded = 0
     failed = 0
+    # (name, type) -> product_id, shared by all reports of this run
+    product_ids: dict[tuple, int] = {}
 
     for file in files:
         report_id = parse_report_id(file)
 
         try:
-            status = process_assets_parsing(str(file))
+            status = process_assets_parsing(str(file), product_ids)
 
             # Normalize the printed line
             label = f"Report {report_id}"
@@ -3,6 +3,8 @@
 # (http://www.apache.org/licenses/LICENSE-2.0)
 
 import json
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 from capitolwatch.db import get_connection
@@ -52,16 +54,31 @@ DEFAULT_THRESHOLDS: Dict[str, float] = {
 }
 
 
+@lru_cache(maxsize=1)
+def _read_manual_overrides(
+    override_file: Path, mtime_ns: int
+) -> Dict[str, str]:
+    """Parse and normalize the overrides file; cached per modification time."""
+    with open(override_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # Normalize keys for stable lookup
+    return {normalize_name(k): v for k, v in data.items()}
+
+
 def load_manual_overrides() -> Dict[str, str]:
-    """Load overrides from disk once and cache them."""
+    """
+    Load overrides from disk once and cache them.
+
+    match_politician runs once per report, so the file is only re-read and
+    re-normalized when its modification time changes (e.g. after
+    add_manual_override). The returned dict is shared: do not mutate it.
+    """
     override_file = CONFIG.data_dir / "manual_overrides.json"
     try:
-        with open(override_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        mtime_ns = override_file.stat().st_mtime_ns
     except FileNotFoundError:
-        data = {}
-    # Normalize keys for stable lookup
-    return {normalize_name(k): v for k, v in data.items()}
+        return {}
+    return _read_manual_overrides(override_file, mtime_ns)
 
 
 def confidence_for(score: float) -> str:
@@ -346,8 +346,10 @@ def get_assets_with_products_dataframe(
             - product_id: ID of the product
             - value: String representation of value range
             - product_name: Name of the product
-            - subtype: Product subtype (e.g., 'Stock', 'Mutual Fund')
-            - sector: Economic sector (e.g., 'Technology', 'Healthcare')
+            - subtype: Product subtype (e.g., 'Stock', 'Mutual Fund'),
+              'Uncategorized' when missing or empty
+            - sector: Economic sector (e.g., 'Technology', 'Healthcare'),
+              'Uncategorized' when missing or empty
 
         Returns all assets with values for active politicians, including:
             - Standalone assets (bank accounts, pension plans)
@@ -361,18 +363,13 @@ def get_assets_with_products_dataframe(
             a.product_id,
             a.value,
             pr.name AS product_name,
-            pr.subtype,
-            pr.sector
+            COALESCE(NULLIF(pr.subtype, ''), 'Uncategorized') AS subtype,
+            COALESCE(NULLIF(pr.sector, ''), 'Uncategorized') AS sector
         FROM assets a
         INNER JOIN products pr ON a.product_id = pr.id
         INNER JOIN reports r ON a.report_id = r.id
         INNER JOIN politicians p ON r.politician_id = p.id
-        WHERE p.id IN (
-            SELECT DISTINCT r2.politician_id
-            FROM reports r2
-            INNER JOIN assets a2 ON r2.id = a2.report_id
-        )
-        AND a.value IS NOT NULL
+        WHERE a.value IS NOT NULL
         AND a.value != ''
         ORDER BY r.politician_id, a.id
     """
@@ -136,6 +136,7 @@ def initialize_database(config):
         ("idx_assets_product_id", "assets", "product_id"),
         ("idx_assets_politician_id", "assets", "politician_id"),
         ("idx_assets_report_id", "assets", "report_id"),
+        ("idx_reports_checksum", "reports", "checksum"),
     ]
 
     for index_name, table, columns in indexes:
@@ -2,7 +2,6 @@
 # Licensed under the Apache License, Version 2.0
 # (http://www.apache.org/licenses/LICENSE-2.0)
 
-import re
 from typing import Optional, Iterable
 
 from capitolwatch.db import get_connection
@@ -11,6 +10,10 @@ from config import CONFIG
 
 # ---------- Utilities ----------
 
+# normalize_name: drop periods and apostrophes, hyphens become spaces
+_NAME_PUNCTUATION = str.maketrans({".": None, "'": None, "-": " "})
+
+
 def normalize_name(name: str) -> str:
     """
     Normalize a personal name: lowercase, remove punctuation, replace hyphens
@@ -18,11 +21,10 @@ def normalize_name(name: str) -> str:
     """
     if not name:
         return ""
-    name = name.lower()
-    name = re.sub(r"[.']", "", name)
-    name = re.sub(r"-", " ", name)
-    name = re.sub(r"\s+", " ", name).strip(", ")
-    return name.strip()
+    # one translate pass drops punctuation and maps hyphens to spaces;
+    # split/join collapses whitespace without another regex pass
+    name = name.lower().translate(_NAME_PUNCTUATION)
+    return " ".join(name.split()).strip(", ")
 
 
 # ---------- Read API (get*) ----------
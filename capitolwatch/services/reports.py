@@ -129,14 +129,51 @@ def get_politician_id(
             connection.close()
 
 
-def get_report_by_checksum(
+def get_matched_politician_ids(
+    *,
+    config: Optional[object] = None,
+    connection=None,
+) -> dict[int, str]:
+    """
+    Return the politician_id of every report that already has one.
+
+    Bulk counterpart of get_politician_id: a single query instead of one
+    round-trip per report.
+
+    Args:
+        config: Optional config override.
+        connection: Optional existing DB connection to reuse.
+
+    Returns:
+        Dict mapping report ID to its linked politician_id; reports with no
+        politician linked are absent.
+    """
+    close = False
+    if connection is None:
+        connection, close = get_connection(config or CONFIG), True
+    try:
+        cur = connection.cursor()
+        cur.execute(
+            "SELECT id, politician_id FROM reports "
+            "WHERE politician_id IS NOT NULL AND politician_id != ''"
+        )
+        return {row["id"]: row["politician_id"] for row in cur.fetchall()}
+    finally:
+        if close:
+            connection.close()
+
+
+def get_report_id_by_checksum(
     checksum: str,
     *,
     config: Optional[object] = None,
     connection=None,
-) -> Optional[dict]:
+) -> Optional[int]:
     """
-    Return a report by its checksum, or None if not found.
+    Return the ID of the report with this checksum, or None if not found.
+
+    The lookup is answered from the checksum index without reading the
+    report row.
 
     Args:
         checksum: SHA-1 checksum of the HTML content.
@@ -144,7 +181,7 @@ def get_report_by_checksum(
         connection: Optional existing DB connection to reuse.
 
     Returns:
-        dict with report data or None if not found.
+        The report ID, or None if no report has this checksum.
     """
     close = False
     if connection is None:
@@ -152,15 +189,11 @@ def get_report_by_checksum(
     try:
         cur = connection.cursor()
         cur.execute(
-            (
-                "SELECT id, checksum, source_file, encoding, "
-                "import_timestamp, url, politician_id, year "
-                "FROM reports WHERE checksum = ? LIMIT 1"
-            ),
+            "SELECT id FROM reports WHERE checksum = ? LIMIT 1",
             (checksum,),
         )
         row = cur.fetchone()
-        return dict(row) if row else None
+        return row["id"] if row else None
     finally:
         if close:
             connection.close()
@@ -254,11 +287,11 @@ def add_report(
 
     try:
         # Check if report with this checksum already exists
-        existing = get_report_by_checksum(
+        existing_id = get_report_id_by_checksum(
             checksum, config=config, connection=connection
         )
-        if existing:
-            return existing["id"]
+        if existing_id is not None:
+            return existing_id
 
         # Insert new report
         if import_timestamp is None:
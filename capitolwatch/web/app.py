@@ -172,16 +172,18 @@ def _build_hover_texts(
     Returns:
         list[str]: HTML-formatted tooltip strings (usable in hovertemplate).
     """
-    texts = []
-    for i, row in politician_metadata.reset_index(drop=True).iterrows():
-        cluster = labels[i]
-        cluster_str = "Outlier" if cluster == -1 else f"Cluster {cluster}"
-        texts.append(
-            f"{row['first_name']} {row['last_name']}<br>"
-            f"Party: {row['party']}<br>"
-            f"{cluster_str}"
-        )
-    return texts
+    meta = politician_metadata.reset_index(drop=True).astype(str)
+    labels = np.asarray(labels)
+    # build all strings column-wise instead of row by row
+    cluster_str = np.where(
+        labels == -1, "Outlier", np.char.add("Cluster ", labels.astype(str))
+    )
+    texts = (
+        meta["first_name"] + " " + meta["last_name"] + "<br>"
+        + "Party: " + meta["party"] + "<br>"
+        + cluster_str
+    )
+    return texts.tolist()
 
 
 def _get_party_colors(politician_metadata: pd.DataFrame) -> list[str]:
@@ -439,12 +441,12 @@ def _tab_external(
     st.subheader("Confusion matrices: cluster vs party")
 
     # Map party strings to integer codes expected by build_confusion_matrix()
+    # (position in _PARTY_ORDER, -1 for unknown parties) in one lookup
     _PARTY_ORDER = ["Republican", "Democratic", "Independent"]
-    _PARTY_ENCODE = {p: i for i, p in enumerate(_PARTY_ORDER)}
 
     politician_metadata = _load_politician_metadata()
-    party_int = np.array(
-        [_PARTY_ENCODE.get(p, -1) for p in politician_metadata["party"]]
+    party_int = pd.Index(_PARTY_ORDER).get_indexer(
+        politician_metadata["party"]
     )
 
     # Map (algo, feature_type) to a cached loader that returns (X, labels)
@@ -288,8 +288,9 @@ def heatmap_confusion_plotly(
     z = conf_matrix.values
     x_labels = list(conf_matrix.columns)
     y_labels = [f"Cluster {i}" for i in conf_matrix.index]
-    # cell annotations as strings for the texttemplate
-    text = [[str(v) for v in row] for row in z]
+    # cell annotations as strings for the texttemplate, converted as one
+    # array instead of cell by cell
+    text = z.astype(str).tolist()
 
     fig = go.Figure(
         go.Heatmap(
@@ -398,8 +399,9 @@ def som_map_plotly(
 
     # --- layer 1: politicians as scatter markers ---
     rng = np.random.default_rng(seed=42)
-    rows = np.array([c[0] for c in bmu_coords], dtype=float)
-    cols = np.array([c[1] for c in bmu_coords], dtype=float)
+    # one (n, 2) float buffer; rows/cols are views into it
+    coords = np.array(bmu_coords, dtype=float).reshape(-1, 2)
+    rows, cols = coords[:, 0], coords[:, 1]
     rows += rng.uniform(-jitter_scale, jitter_scale, size=len(rows))
     cols += rng.uniform(-jitter_scale, jitter_scale, size=len(cols))
 
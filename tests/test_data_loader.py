@@ -63,6 +63,16 @@ class TestParseValueRange:
         expected = (1001 + 15000) / 2
         assert result == expected
 
+    def test_parse_value_range_unascertainable(self):
+        """Test that values without a usable range parse to 0"""
+        assert parse_value_range("Unascertainable") == 0.0
+
+    def test_parse_value_range_without_spaces(self):
+        """Test parsing a range the fast path leaves to the regexes"""
+        result = parse_value_range("$1,001-$15,000")
+        expected = (1001 + 15000) / 2
+        assert result == expected
+
 
 class TestLoadPoliticians:
     """Tests for load_politicians function"""
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 Seizh7
+# Licensed under the Apache License, Version 2.0
+# (http://www.apache.org/licenses/LICENSE-2.0)
+
+import json
+import os
+from types import SimpleNamespace
+
+import joblib
+import pandas as pd
+import pytest
+
+from capitolwatch.analysis import feature_store, run_evaluation
+
+
+FINGERPRINT = {"db_path": "test.db", "size": 10, "mtime_ns": 1}
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    """Redirect the feature store files to a temporary directory."""
+    files = {
+        name: tmp_path / path.name
+        for name, path in feature_store.FEATURE_FILES.items()
+    }
+    monkeypatch.setattr(feature_store, "FEATURE_FILES", files)
+    monkeypatch.setattr(
+        feature_store, "MANIFEST_FILE", tmp_path / "manifest.json"
+    )
+    monkeypatch.setattr(
+        feature_store, "_database_fingerprint", lambda: dict(FINGERPRINT)
+    )
+    for path in files.values():
+        path.touch()
+    return tmp_path
+
+
+class TestIsFeatureStoreCurrent:
+
+    def test_false_without_manifest(self, store_dir):
+        """A store with no manifest must be rebuilt."""
+        assert not feature_store.is_feature_store_current()
+
+    def test_true_when_manifest_matches(self, store_dir):
+        """A manifest matching the database fingerprint means up to date."""
+        feature_store.MANIFEST_FILE.write_text(json.dumps(FINGERPRINT))
+        assert feature_store.is_feature_store_current()
+
+    def test_false_when_database_changed(self, store_dir):
+        """A different database fingerprint must trigger a rebuild."""
+        stale = dict(FINGERPRINT, mtime_ns=0)
+        feature_store.MANIFEST_FILE.write_text(json.dumps(stale))
+        assert not feature_store.is_feature_store_current()
+
+    def test_false_when_a_file_is_missing(self, store_dir):
+        """A missing matrix file must trigger a rebuild."""
+        feature_store.MANIFEST_FILE.write_text(json.dumps(FINGERPRINT))
+        feature_store.FEATURE_FILES["freq_weighted"].unlink()
+        assert not feature_store.is_feature_store_current()
+
+    def test_build_skipped_when_current(self, store_dir):
+        """build_feature_store must return False without touching the DB."""
+        feature_store.MANIFEST_FILE.write_text(json.dumps(FINGERPRINT))
+        assert feature_store.build_feature_store() is False
+
+
+    def test_fingerprint_changes_with_store_version(
+        self, tmp_path, monkeypatch
+    ):
+        """Bumping FEATURE_STORE_VERSION must invalidate existing stores."""
+        db_path = tmp_path / "test.db"
+        db_path.touch()
+        monkeypatch.setattr(
+            feature_store, "CONFIG", SimpleNamespace(db_path=db_path)
+        )
+        before = feature_store._database_fingerprint()
+        monkeypatch.setattr(
+            feature_store,
+            "FEATURE_STORE_VERSION",
+            feature_store.FEATURE_STORE_VERSION + 1,
+        )
+        assert feature_store._database_fingerprint() != before
+
+
+class TestLoadFeatures:
+
+    def test_returns_independent_copies(self, store_dir):
+        """Cached loads must not share the same DataFrame between callers."""
+        path = feature_store.FEATURE_FILES["freq_baseline"]
+        joblib.dump(pd.DataFrame({"a": [1, 2]}), path)
+        first = feature_store.load_features("freq_baseline")
+        first.loc[0, "a"] = 99
+        second = feature_store.load_features("freq_baseline")
+        assert second["a"].tolist() == [1, 2]
+
+    def test_rebuilt_file_is_reloaded(self, store_dir):
+        """A file rewritten after a load must not be served from the cache."""
+        path = feature_store.FEATURE_FILES["freq_baseline"]
+        joblib.dump(pd.DataFrame({"a": [1]}), path)
+        feature_store.load_features("freq_baseline")
+        joblib.dump(pd.DataFrame({"a": [2]}), path)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        reloaded = feature_store.load_features("freq_baseline")
+        assert reloaded["a"].tolist() == [2]
+
+    def test_version_changes_when_rebuilt(self, store_dir):
+        """Rewriting a store file must change its version token."""
+        path = feature_store.FEATURE_FILES["freq_baseline"]
+        before = feature_store.get_feature_version("freq_baseline")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert feature_store.get_feature_version("freq_baseline") != before
+
+    def test_scaled_matrix_follows_rebuilt_file(self, store_dir):
+        """Cached scaled matrices must be recomputed after a rebuild."""
+        path = feature_store.FEATURE_FILES["freq_baseline"]
+        joblib.dump(pd.DataFrame({"a": [0.0, 1.0, 2.0]}), path)
+        first = run_evaluation._load_minmax("freq_baseline")
+        joblib.dump(pd.DataFrame({"a": [2.0, 1.0, 0.0]}), path)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        second = run_evaluation._load_minmax("freq_baseline")
+        assert first[:, 0].tolist() == [0.0, 0.5, 1.0]
+        assert second[:, 0].tolist() == [1.0, 0.5, 0.0]
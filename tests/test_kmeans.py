@@ -3,10 +3,12 @@
 # (http://www.apache.org/licenses/LICENSE-2.0)
 
 import numpy as np
+import pandas as pd
 import pytest
 from sklearn.datasets import make_blobs
 
 from capitolwatch.analysis.clustering.kmeans import KMeansClusterer
+from capitolwatch.analysis.clustering.run_kmeans import _fit_and_analyze
 
 
 def make_matrix(n_samples=60, n_clusters=3, random_state=0):
@@ -163,3 +165,18 @@ class TestFindOptimalK:
         k_values, _, sil_scores = c.find_optimal_k(X, k_min=2, k_max=8)
         best_k = k_values[sil_scores.index(max(sil_scores))]
         assert best_k == 3
+
+
+class TestFitAndAnalyze:
+
+    def test_singleton_defaults_for_missing_columns(self):
+        """Singleton outliers fall back to defaults for missing columns."""
+        X = np.vstack([make_matrix(), [[100.0, 100.0]]])
+        labels = pd.DataFrame({"last_name": [f"n{i}" for i in range(61)]})
+        _, outliers = _fit_and_analyze(X, 4, labels)
+        assert outliers == [{
+            "index": 60,
+            "first_name": "",
+            "last_name": "n60",
+            "party": "N/A",
+        }]
@@ -125,6 +125,39 @@ class TestSOMClustererFit:
             assert 0 <= row < 4
             assert 0 <= col < 6
 
+    def test_batch_training(self):
+        """Batch training must produce valid BMUs for every sample."""
+        X = make_normalized_matrix(n_samples=30)
+        c = SOMClusterer(m=4, n=6, n_iterations=20, batch=True)
+        c.fit(X)
+        assert len(c.bmu_coords_) == 30
+        for row, col in c.bmu_coords_:
+            assert 0 <= row < 4
+            assert 0 <= col < 6
+        assert np.all(np.isfinite(c._som.get_weights()))
+
+    def test_batch_training_reduces_quantization_error(self):
+        """Batch epochs must bring the neurons closer to the samples."""
+        from minisom import MiniSom
+        X = make_normalized_matrix(n_samples=60)
+        initial = MiniSom(4, 6, X.shape[1], random_seed=42)
+        initial.random_weights_init(X)
+        c = SOMClusterer(m=4, n=6, n_iterations=20, batch=True)
+        c.fit(X)
+        trained_error = c._som.quantization_error(X)
+        assert trained_error < initial.quantization_error(X)
+
+    def test_numba_bmu_kernel_matches_gemm(self, monkeypatch):
+        """The numba BMU kernel must pick the same neurons as the GEMM path."""
+        from capitolwatch.analysis.clustering import som
+
+        pytest.importorskip("numba")
+        X = make_normalized_matrix(n_samples=60)
+        c = SOMClusterer(m=5, n=5, n_iterations=100).fit(X)
+        expected = c._bmu_indices(X)
+        monkeypatch.setattr(som, "_DISTANCE_BLOCK_SIZE", 1)
+        np.testing.assert_array_equal(c._bmu_indices(X), expected)
+
     def test_labels_none_before_extract_clusters(self):
         """labels_ must remain None until extract_clusters() is called."""
         X = make_normalized_matrix()
@@ -147,6 +180,14 @@ class TestSOMClustererGetBmuCoords:
             assert isinstance(item, tuple)
             assert len(item) == 2
 
+    def test_matches_minisom_winner(self):
+        """Vectorized BMU lookup must agree with MiniSom.winner()."""
+        X = make_normalized_matrix(n_samples=40)
+        c = SOMClusterer(m=4, n=5, n_iterations=50)
+        c.fit(X)
+        expected = [tuple(int(v) for v in c._som.winner(x)) for x in X]
+        assert c.get_bmu_coords(X) == expected
+
     def test_raises_before_fit(self):
         """get_bmu_coords must raise RuntimeError if model not fitted."""
         X = make_normalized_matrix(n_samples=10)
@@ -225,7 +266,7 @@ class TestSOMClustererExtractClusters:
 class TestSOMClustererGetParams:
 
     def test_returns_dict_with_expected_keys(self):
-        """get_params must return all six hyperparameter keys."""
+        """get_params must return all seven hyperparameter keys."""
         c = SOMClusterer(m=7, n=8, sigma=0.8, learning_rate=0.4,
                          n_iterations=500, random_seed=1)
         params = c.get_params()
@@ -236,6 +277,7 @@ class TestSOMClustererGetParams:
             "learning_rate": 0.4,
             "n_iterations": 500,
             "random_seed": 1,
+            "batch": False,
         }
 
 